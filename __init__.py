@@ -24,13 +24,15 @@ from os import path as os_path
 from logging import getLogger, basicConfig, INFO
 from sys import path as sys_path
 
-from .common import load_component_class, group_component_args, COMPONENT_ARG_FORMAT
+from .common import import_component_class, group_component_args, COMPONENT_ARG_FORMAT
 from .component_base import KX_PythonComponent
 from .unions import GameObjectMixin, make_generic_property
 
 
 MAINLOOP_FILE_NAME = "mainloop.py"
-REQUIRED_FILE_NAMES = "component_base.py", "common.py", "component_system.py", "components.py", MAINLOOP_FILE_NAME
+REQUIRED_FILE_NAMES = ("component_base.py", "common.py", "component_system.py", "components.py", "profiling.py",
+                       "scheduler.py", "wake_queue.py", "coroutines.py", "compute_pool.py", "jobs.py", "spatial_lod.py",
+                       "component_store.py", "message_bus.py", "lifecycle.py", "snapshot.py", MAINLOOP_FILE_NAME)
 
 ADDON_DIR = os_path.dirname(__file__)
 basicConfig(level=INFO)
@@ -135,7 +137,8 @@ class LOGIC_OT_add_component(Operator):
             current_file_path = bpy.path.abspath("//")
             with temporary_add_path(current_file_path):
                 try:
-                    component_cls = load_component_class(import_path)
+                    # Bypass the runtime class cache, so that edits to the script are picked up
+                    component_cls = import_component_class(import_path)
 
                 except Exception as err:
                     self.report({'ERROR'}, "Unable to import module {!r}: {}".format(import_path, err))
@@ -0,0 +1,72 @@
+"""Component classes used by the benchmark scenes"""
+import bge
+
+from collections import OrderedDict
+from component_store import Field
+from mathutils import Vector
+
+
+class Spinner(bge.types.KX_PythonComponent):
+
+    args = OrderedDict((
+        ("Speed", 0.1),
+        ("Axis", Vector((0.0, 0.0, 1.0))),
+    ))
+
+    def start(self, args):
+        self.speed = args['Speed']
+        self.axis = args['Axis']
+        self.angle = 0.0
+
+    def update(self):
+        self.angle += self.speed
+
+
+class Mover(bge.types.KX_PythonComponent):
+
+    args = OrderedDict((
+        ("Velocity", Vector((1.0, 0.0, 0.0))),
+        ("Enabled", True),
+        ("Steps", 10),
+    ))
+
+    def start(self, args):
+        self.velocity = args['Velocity']
+        self.enabled = args['Enabled']
+        self.steps = args['Steps']
+
+    def update(self):
+        if self.enabled:
+            self.object.worldPosition = self.object.worldPosition + self.velocity
+
+
+class Tagged(bge.types.KX_PythonComponent):
+
+    args = OrderedDict((
+        ("Tag", "enemy"),
+        ("Team", ("red", "blue")),
+    ))
+
+    def start(self, args):
+        self.tag = args['Tag']
+        self.team = args['Team']
+
+
+class SlottedSpinner(bge.types.KX_PythonComponent):
+    """Spinner with its state stored in Fields"""
+
+    __slots__ = ()
+
+    args = Spinner.args
+
+    speed = Field('d', 0.1)
+    angle = Field('d', 0.0)
+
+    def start(self, args):
+        self.speed = args['Speed']
+
+    def update(self):
+        self.angle += self.speed
+
+
+COMPONENT_CLASSES = Spinner, Mover, Tagged
@@ -0,0 +1,175 @@
+"""Stand-in bge and mathutils modules for running the component runtime outside of Blender"""
+import sys
+import types
+
+from math import sqrt
+
+
+class Vector:
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self._values = [float(x) for x in seq]
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __setitem__(self, index, value):
+        self._values[index] = float(value)
+
+    def __eq__(self, other):
+        return isinstance(other, Vector) and self._values == other._values
+
+    def __hash__(self):
+        return hash(tuple(self._values))
+
+    def __add__(self, other):
+        return Vector(a + b for a, b in zip(self, other))
+
+    def __sub__(self, other):
+        return Vector(a - b for a, b in zip(self, other))
+
+    def __mul__(self, scalar):
+        return Vector(a * scalar for a in self)
+
+    def __repr__(self):
+        return "Vector(({}))".format(", ".join(repr(x) for x in self._values))
+
+    def copy(self):
+        return Vector(self._values)
+
+    __copy__ = copy
+
+    @property
+    def length(self):
+        return sqrt(sum(x * x for x in self._values))
+
+    x = property(lambda self: self._values[0], lambda self, value: self.__setitem__(0, value))
+    y = property(lambda self: self._values[1], lambda self, value: self.__setitem__(1, value))
+    z = property(lambda self: self._values[2], lambda self, value: self.__setitem__(2, value))
+
+
+class PropertyMixin:
+    """Dictionary-like game property access"""
+
+    def __getitem__(self, name):
+        return self._properties[name]
+
+    def __setitem__(self, name, value):
+        self._properties[name] = value
+
+    def __delitem__(self, name):
+        del self._properties[name]
+
+    def __contains__(self, name):
+        return name in self._properties
+
+    def get(self, name, default=None):
+        return self._properties.get(name, default)
+
+
+class KX_GameObject(PropertyMixin):
+
+    def __init__(self, name, properties=None, position=(0.0, 0.0, 0.0)):
+        self.name = name
+        self.invalid = False
+        self.scene = None
+        self.worldPosition = Vector(position)
+
+        self._properties = dict(properties or {})
+
+    def getDistanceTo(self, other):
+        return (self.worldPosition - other.worldPosition).length
+
+    def getPropertyNames(self):
+        return list(self._properties)
+
+    def setLinearVelocity(self, velocity, local=False):
+        pass
+
+    def applyRotation(self, rotation, local=False):
+        pass
+
+    def endObject(self):
+        self.scene.remove_object(self)
+
+    def replicate(self, position):
+        properties = {k: v for k, v in self._properties.items() if isinstance(v, (str, int, float, bool))}
+        return KX_GameObject(self.name, properties, position)
+
+
+class KX_Scene(PropertyMixin):
+
+    def __init__(self, name="Scene"):
+        self.name = name
+        self.invalid = False
+        self.suspended = False
+        self.objects = []
+        self.objectsInactive = {}
+        self.active_camera = KX_GameObject("Camera")
+
+        self._properties = {}
+
+    def add_object(self, obj):
+        obj.scene = self
+        self.objects.append(obj)
+        return obj
+
+    def remove_object(self, obj):
+        # The engine releases the game properties of ended objects
+        obj.invalid = True
+        obj._properties.clear()
+        self.objects.remove(obj)
+
+    def addObject(self, name, reference=None, time=0):
+        position = reference.worldPosition if reference is not None else (0.0, 0.0, 0.0)
+        return self.add_object(self.objectsInactive[name].replicate(position))
+
+    def end(self):
+        self.invalid = True
+
+        for obj in self.objects:
+            obj.invalid = True
+            obj._properties.clear()
+
+
+class InputDevice:
+
+    def __init__(self):
+        self.events = {}
+        self.active_events = {}
+
+
+def install():
+    """Install the stand-in modules into sys.modules, replacing any existing bge and mathutils modules"""
+    mathutils = sys.modules['mathutils'] = types.ModuleType("mathutils")
+    mathutils.Vector = Vector
+
+    bge = sys.modules['bge'] = types.ModuleType("bge")
+    bge.types = sys.modules['bge.types'] = types.ModuleType("bge.types")
+    bge.logic = sys.modules['bge.logic'] = types.ModuleType("bge.logic")
+    bge.events = sys.modules['bge.events'] = types.ModuleType("bge.events")
+
+    bge.types.KX_GameObject = KX_GameObject
+    bge.types.KX_Scene = KX_Scene
+
+    for index, name in enumerate(("WKEY", "AKEY", "SKEY", "DKEY", "ESCKEY")):
+        setattr(bge.events, name, index)
+
+    logic = bge.logic
+    logic.scenes = []
+    logic.keyboard = InputDevice()
+    logic.mouse = InputDevice()
+    logic.getSceneList = lambda: list(logic.scenes)
+    logic.getCurrentScene = lambda: logic.scenes[0]
+    logic.getLogicTicRate = lambda: 60.0
+    logic.getExitKey = lambda: bge.events.ESCKEY
+    logic.expandPath = lambda path: path.replace("//", "", 1)
+    logic.NextFrame = lambda: None
+
+    return bge
@@ -0,0 +1,314 @@
+"""Headless benchmarks of the component runtime hot paths.
+
+Usage: python benchmarks/run.py [--objects N] [--component-ratio R] [--properties N] [--repeat N] [--json PATH]
+"""
+import sys
+
+from argparse import ArgumentParser
+from collections import OrderedDict
+from json import dump
+from os import path as os_path
+from random import Random
+from statistics import median
+from time import perf_counter
+from tracemalloc import start as start_tracing, stop as stop_tracing, get_traced_memory
+
+BENCHMARKS_DIR = os_path.dirname(os_path.abspath(__file__))
+sys.path[:0] = [os_path.dirname(BENCHMARKS_DIR), BENCHMARKS_DIR]
+
+import fake_bge
+fake_bge.install()
+
+import component_system
+import snapshot
+
+from bench_components import COMPONENT_CLASSES, Spinner, SlottedSpinner
+from common import COMPONENT_ARG_FORMAT, group_component_args, to_json_string, from_json_string, encode_value, \
+    decode_value
+
+
+def serialise_default(value, encode=encode_value):
+    # Enum defaults are stored as the name of their first item
+    if isinstance(value, (list, set, tuple)):
+        value = next(iter(value))
+
+    return encode(value)
+
+
+def make_component_properties(component_classes):
+    properties = {}
+
+    for cls in component_classes:
+        import_path = "{}.{}".format(cls.__module__, cls.__name__)
+
+        for name, value in cls.args.items():
+            prop_name = COMPONENT_ARG_FORMAT.format(import_path=import_path, class_name=name)
+            properties[prop_name] = serialise_default(value)
+
+    return properties
+
+
+def make_template_properties(random, properties, max_components):
+    """Return the game properties of an object with random components and plain properties"""
+    component_count = random.randint(1, max_components)
+    component_classes = random.sample(COMPONENT_CLASSES, component_count)
+
+    template = make_component_properties(component_classes)
+    for index in range(properties):
+        template["prop_{}".format(index)] = index
+
+    return template
+
+
+class SceneBuilder:
+    """Build reproducible synthetic scenes.
+
+    :param objects: number of objects in the scene
+    :param component_ratio: fraction of objects with components
+    :param properties: number of plain game properties per object
+    :param templates: number of distinct component-bearing object types
+    :param max_components: maximum number of components per object
+    :param seed: random seed
+    """
+
+    def __init__(self, objects=1000, component_ratio=0.1, properties=4, templates=8, max_components=3, seed=0):
+        self.objects = objects
+        self.component_ratio = component_ratio
+        self.properties = properties
+
+        random = self.random = Random(seed)
+        self.templates = [make_template_properties(random, properties, max_components) for _ in range(templates)]
+        self.plain_properties = {"prop_{}".format(i): i for i in range(properties)}
+
+    def make_component_object(self, index):
+        template = self.random.choice(self.templates)
+        position = [self.random.uniform(-500, 500) for _ in range(3)]
+        return fake_bge.KX_GameObject("component_{}".format(index), template, position)
+
+    def make_object(self, index):
+        if self.random.random() < self.component_ratio:
+            return self.make_component_object(index)
+
+        return fake_bge.KX_GameObject("prop_{}".format(index), self.plain_properties)
+
+    def build(self):
+        scene = fake_bge.KX_Scene()
+        for index in range(self.objects):
+            scene.add_object(self.make_object(index))
+
+        for index, template in enumerate(self.templates):
+            scene.objectsInactive["template_{}".format(index)] = fake_bge.KX_GameObject("template", template)
+
+        return scene
+
+
+def measure(function, repeat, number=1, setup=None):
+    """Return the median and minimum time in seconds of a single call to function"""
+    timings = []
+
+    for _ in range(repeat):
+        args = setup() if setup is not None else ()
+
+        start_time = perf_counter()
+        for _ in range(number):
+            function(*args)
+        timings.append((perf_counter() - start_time) / number)
+
+    return median(timings), min(timings)
+
+
+def bench_group_component_args(builder, repeat):
+    properties = builder.make_component_object(0)._properties
+    return measure(group_component_args, repeat, number=1000, setup=lambda: (properties,))
+
+
+def bench_init_components(builder, repeat):
+    def setup():
+        return [builder.make_component_object(i) for i in range(100)],
+
+    def init_objects(objects):
+        for obj in objects:
+            component_system.init_components(obj)
+
+    median_time, min_time = measure(init_objects, repeat, setup=setup)
+    return median_time / 100, min_time / 100
+
+
+def bench_update_scene(builder, repeat):
+    scene = builder.build()
+    component_system.update_scene(scene)
+
+    return measure(component_system.update_scene, repeat, number=10, setup=lambda: (scene,))
+
+
+def bench_spawn(builder, repeat, count=100):
+    def setup():
+        scene = builder.build()
+        component_system.update_scene(scene)
+
+        for index in range(count):
+            scene.add_object(builder.make_component_object(index))
+
+        return scene,
+
+    return measure(component_system.update_scene, repeat, setup=setup)
+
+
+def get_codec_values(encode):
+    values = []
+    for cls in COMPONENT_CLASSES:
+        values.extend(cls.args.values())
+
+    return [serialise_default(value, encode) for value in values]
+
+
+def make_codec_benchmark(function, input_function, input_encode):
+    """Return a benchmark of the per value time of a codec function"""
+    def bench_codec(builder, repeat):
+        values = [input_function(value) for value in get_codec_values(input_encode)]
+
+        def run_codec():
+            for value in values:
+                function(value)
+
+        median_time, min_time = measure(run_codec, repeat, number=1000)
+        return median_time / len(values), min_time / len(values)
+
+    return bench_codec
+
+
+def bench_decode_scene(builder, repeat):
+    """Decode the arguments of every component-bearing object in a scene"""
+    scene = builder.build()
+    values = [value for obj in scene.objects for name, value in obj._properties.items() if name.startswith("$")]
+
+    def decode():
+        for value in values:
+            decode_value(value)
+
+    return measure(decode, repeat)
+
+
+def build_field_scene(builder):
+    """Build a scene of started components with Fields, with as many objects as the component-bearing ones"""
+    properties = make_component_properties([SlottedSpinner])
+    count = max(1, round(builder.objects * builder.component_ratio))
+
+    scene = fake_bge.KX_Scene()
+    for index in range(count):
+        scene.add_object(fake_bge.KX_GameObject("snapshot_{}".format(index), properties))
+
+    component_system.update_scene(scene)
+    return scene
+
+
+def bench_take_snapshot(builder, repeat):
+    scene = build_field_scene(builder)
+    return measure(snapshot.take_snapshot, repeat, setup=lambda: ([scene],))
+
+
+def bench_restore_snapshot(builder, repeat):
+    scene = build_field_scene(builder)
+    data = snapshot.take_snapshot([scene])
+    return measure(snapshot.restore_snapshot, repeat, setup=lambda: (data, [scene]))
+
+
+BENCHMARKS = OrderedDict((
+    ("group_component_args", bench_group_component_args),
+    ("init_components (per object)", bench_init_components),
+    ("update_scene", bench_update_scene),
+    ("update_scene (100 spawned)", bench_spawn),
+    ("to_json_string (per value)", make_codec_benchmark(to_json_string, from_json_string, to_json_string)),
+    ("from_json_string (per value)", make_codec_benchmark(from_json_string, str, to_json_string)),
+    ("encode_value (per value)", make_codec_benchmark(encode_value, decode_value, encode_value)),
+    ("decode_value (per value)", make_codec_benchmark(decode_value, str, encode_value)),
+    ("decode_value (legacy JSON, per value)", make_codec_benchmark(decode_value, str, to_json_string)),
+    ("decode_value (scene arguments)", bench_decode_scene),
+    ("take_snapshot", bench_take_snapshot),
+    ("restore_snapshot", bench_restore_snapshot),
+))
+
+
+def make_memory_benchmark(cls):
+    """Return a benchmark of the memory allocated per component of a class, after it is started and updated"""
+    def bench_memory(builder, count=10000):
+        properties = make_component_properties([cls])
+        objects = [fake_bge.KX_GameObject("memory_{}".format(i), properties) for i in range(count)]
+
+        start_tracing()
+        components = [component_system.init_components(obj) for obj in objects]
+        for object_components in components:
+            for component in object_components:
+                component.update()
+
+        size, peak = get_traced_memory()
+        stop_tracing()
+
+        return size / len(components)
+
+    return bench_memory
+
+
+MEMORY_BENCHMARKS = OrderedDict((
+    ("component memory (__dict__)", make_memory_benchmark(Spinner)),
+    ("component memory (__slots__ and Fields)", make_memory_benchmark(SlottedSpinner)),
+))
+
+
+def run_memory_benchmarks(builder, names=None):
+    results = OrderedDict()
+
+    for name, benchmark in MEMORY_BENCHMARKS.items():
+        if names and not any(n in name for n in names):
+            continue
+
+        results[name] = benchmark(builder)
+
+    return results
+
+
+def run_benchmarks(builder, repeat, names=None):
+    results = OrderedDict()
+
+    for name, benchmark in BENCHMARKS.items():
+        if names and not any(n in name for n in names):
+            continue
+
+        median_time, min_time = benchmark(builder, repeat)
+        results[name] = OrderedDict((("median", median_time), ("min", min_time)))
+
+    return results
+
+
+def main(argv=None):
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=5000)
+    parser.add_argument("--component-ratio", type=float, default=0.1)
+    parser.add_argument("--properties", type=int, default=4)
+    parser.add_argument("--templates", type=int, default=8)
+    parser.add_argument("--max-components", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--filter", nargs="*", help="only run benchmarks whose name contains one of these strings")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    builder = SceneBuilder(args.objects, args.component_ratio, args.properties, args.templates, args.max_components,
+                           args.seed)
+    results = run_benchmarks(builder, args.repeat, args.filter)
+    memory_results = run_memory_benchmarks(builder, args.filter)
+
+    for name, timings in results.items():
+        print("{:<40} median {:>10.2f} us    min {:>10.2f} us".format(name, timings["median"] * 1e6,
+                                                                       timings["min"] * 1e6))
+
+    for name, size in memory_results.items():
+        print("{:<40} {:>10.0f} bytes per component".format(name, size))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            dump(OrderedDict((("timings", results), ("memory", memory_results))), f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
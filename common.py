@@ -39,10 +39,103 @@ def from_json_string(json):
     return loads(json, cls=VectorDecoder)
 
 
+# Component arguments are encoded as <prefix><type code><payload>. JSON never starts with '#', so arguments stored by
+# earlier versions as JSON strings are still decoded.
+ARG_CODEC_VERSION = 1
+ARG_CODEC_PREFIX = "#{}".format(ARG_CODEC_VERSION)
+
+_type_codes = {
+    'vector2': 'v',
+    'vector3': 'v',
+    'vector4': 'v',
+    'integer': 'i',
+    'boolean': 'b',
+    'float': 'f',
+    'string': 's',
+    'enum': 'e',
+}
+
+
+def _infer_type_name(value):
+    if isinstance(value, bool):
+        return 'boolean'
+
+    if isinstance(value, int):
+        return 'integer'
+
+    if isinstance(value, float):
+        return 'float'
+
+    if isinstance(value, str):
+        return 'string'
+
+    if isinstance(value, Vector):
+        return "vector{}".format(len(value))
+
+    raise TypeError("Unable to encode value {!r} of type {!r}".format(value, type(value).__name__))
+
+
+def _encode_payload(type_code, value):
+    if type_code == 'v':
+        return ','.join(repr(float(x)) for x in value)
+
+    if type_code == 'b':
+        return '1' if value else '0'
+
+    if type_code == 'f':
+        return repr(float(value))
+
+    if type_code == 'i':
+        return str(int(value))
+
+    return value
+
+
+def encode_value(value, type_name=None):
+    """Encode a component argument value as a string.
+
+    :param value: value to encode
+    :param type_name: name of value type in unions.factories, or None to infer it from the value
+    """
+    if type_name is None:
+        type_name = _infer_type_name(value)
+
+    type_code = _type_codes[type_name]
+    return ARG_CODEC_PREFIX + type_code + _encode_payload(type_code, value)
+
+
+def _decode_vector(payload):
+    return Vector([float(x) for x in payload.split(',')])
+
+
+def _decode_boolean(payload):
+    return payload == '1'
+
+
+_decoders = {
+    'v': _decode_vector,
+    'i': int,
+    'b': _decode_boolean,
+    'f': float,
+    's': str,
+    'e': str,
+}
+
+_prefix_length = len(ARG_CODEC_PREFIX)
+
+
+def decode_value(string):
+    """Decode a component argument value encoded by encode_value (or to_json_string)"""
+    if not string.startswith(ARG_CODEC_PREFIX):
+        return from_json_string(string)
+
+    return _decoders[string[_prefix_length]](string[_prefix_length + 1:])
+
+
 ComponentProperty = namedtuple("ComponentProperty", "import_path arg_name")
 
 
-def load_component_class(import_path):
+def import_component_class(import_path):
     try:
         module_path, class_name = import_path.rsplit('.', 1)
     except ValueError:
@@ -54,6 +147,68 @@ def load_component_class(import_path):
     return cls
 
 
+class ComponentClassCache:
+    """Cache of component classes by import path.
+
+    Failed lookups are cached too, and raise the original error until the import path is invalidated.
+    """
+
+    def __init__(self):
+        self._classes = {}
+        self._errors = {}
+
+    def load(self, import_path):
+        try:
+            return self._classes[import_path]
+
+        except KeyError:
+            pass
+
+        try:
+            error = self._errors[import_path]
+
+        except KeyError:
+            pass
+
+        else:
+            raise error.with_traceback(None)
+
+        try:
+            cls = import_component_class(import_path)
+
+        except Exception as err:
+            self._errors[import_path] = err
+            raise
+
+        self._classes[import_path] = cls
+        return cls
+
+    def invalidate(self, import_path=None):
+        """Forget the cached class (or error) of an import path, or of every import path if None is given"""
+        if import_path is None:
+            self._classes.clear()
+            self._errors.clear()
+
+        else:
+            self._classes.pop(import_path, None)
+            self._errors.pop(import_path, None)
+
+    def invalidate_module(self, module_path):
+        """Forget the cached classes (and errors) of the import paths within a module, e.g. after it is reloaded"""
+        prefix = module_path + '.'
+
+        for cache in self._classes, self._errors:
+            for import_path in [p for p in cache if p.startswith(prefix)]:
+                del cache[import_path]
+
+
+component_class_cache = ComponentClassCache()
+
+
+def load_component_class(import_path):
+    return component_class_cache.load(import_path)
+
+
 COMPONENT_ARG_PREFIX = "$"
 COMPONENT_ARG_SEP = ":"
 COMPONENT_ARG_FORMAT = COMPONENT_ARG_PREFIX + "{import_path}" + COMPONENT_ARG_SEP + "{class_name}"
@@ -86,4 +241,33 @@ def group_component_args(properties):
 
         component_data[data.arg_name] = value
 
-    return components
\ No newline at end of file
+    return components
+
+
+_schema_cache = {}
+
+
+def get_component_schema(property_names):
+    """Return the components described by a sequence of game property names.
+
+    The result is a tuple of (import_path, ((arg_name, property_name), ...)) pairs, cached by the property names so
+    that objects of the same type are only parsed once.
+
+    :param property_names: sequence of game property names
+    """
+    key = tuple(property_names)
+
+    try:
+        return _schema_cache[key]
+
+    except KeyError:
+        pass
+
+    component_data = group_component_args(OrderedDict((name, name) for name in key))
+    schema = _schema_cache[key] = tuple((import_path, tuple(arg_names.items()))
+                                        for import_path, arg_names in component_data.items())
+    return schema
+
+
+def clear_schema_cache():
+    _schema_cache.clear()
\ No newline at end of file
@@ -1,4 +1,38 @@
+PHASE_PRE_PHYSICS = "pre_physics"
+PHASE_DEFAULT = "default"
+PHASE_LATE = "late"
+
+# Update order of the phases components may declare
+PHASES = PHASE_PRE_PHYSICS, PHASE_DEFAULT, PHASE_LATE
+
+PRIORITY_NORMAL = "normal"
+# Low priority components are updated after all others, whilst the frame budget allows
+PRIORITY_LOW = "low"
+
+# Return the component registry of a scene; installed by component_system, which can't be imported from this module
+get_registry = None
+
+
 class KX_PythonComponent:
+    # Subclasses which define __slots__ have no instance __dict__
+    __slots__ = "object", "_store_index", "__weakref__"
+
+    phase = PHASE_DEFAULT
+    priority = PRIORITY_NORMAL
+
+    # Maximum number of instances kept for reuse after their objects end; 0 disables pooling
+    pool_size = 0
+
+    # Sequence of (distance, update interval) pairs, sorted by distance from the focus object (see spatial_lod), or None
+    lod_bands = None
+
+    # Thread-safe components have compute() called on a worker thread, followed by commit() on the main thread,
+    # instead of update()
+    thread_safe = False
+
+    # Ticks between updates, or seconds between updates if update_period is not None
+    update_interval = 1
+    update_period = None
 
     def __init__(self, obj):
         self.object = obj
@@ -8,3 +42,81 @@ class KX_PythonComponent:
 
     def update(self):
         pass
+
+    def dispose(self):
+        """Release references to other objects and components, when this object ends or its scene is removed"""
+        pass
+
+    def reset(self, args):
+        """Restart a pooled component for a newly spawned object (self.object), instead of start()"""
+        self.start(args)
+
+    def compute(self):
+        """Compute the results of a tick, without using the bge API (thread-safe components only)"""
+        pass
+
+    def commit(self):
+        """Apply the results of compute() (thread-safe components only)"""
+        pass
+
+    def sleep(self, duration=None, events=(), messages=False):
+        """Stop updating this component until woken.
+
+        The component is woken when any given condition is met, or when wake() is called.
+
+        :param duration: seconds to sleep for, or None
+        :param events: keyboard or mouse event codes which wake the component when active
+        :param messages: if True, wake the component when it is sent a message
+        """
+        get_registry(self.object.scene).sleep_component(self, duration, events, messages)
+
+    def wake(self):
+        get_registry(self.object.scene).wake_queue.wake(self)
+
+    @property
+    def sleeping(self):
+        return self in get_registry(self.object.scene).wake_queue.sleeping
+
+    def send(self, message):
+        """Send a message to this component, waking it if it sleeps until a message is received"""
+        self.receive(message)
+        get_registry(self.object.scene).wake_queue.notify_message(self)
+
+    def receive(self, message):
+        pass
+
+    def publish(self, topic, **values):
+        """Publish a message to the scene's message bus (see message_bus.Topic)"""
+        get_registry(self.object.scene).messages.publish(topic, **values)
+
+    def subscribe(self, topic, callback):
+        """Call callback(messages) with the messages of a topic published each tick, until the object ends"""
+        get_registry(self.object.scene).messages.subscribe(topic, callback, self)
+
+    def unsubscribe(self, topic, callback):
+        """Stop calling callback with the messages of a topic"""
+        get_registry(self.object.scene).messages.unsubscribe(topic, callback, self)
+
+    def start_coroutine(self, coroutine):
+        """Run a coroutine (or generator) which awaits (or yields) the conditions in the coroutines module.
+
+        The coroutine is cancelled when the object ends.
+        """
+        return get_registry(self.object.scene).tasks.start(coroutine, self)
+
+    def submit(self, function, *args, callback=None, error_callback=None):
+        """Run function(*args) in a worker process, and return the Job.
+
+        function and args must be picklable. callback(result), or error_callback(error), is invoked on the main thread
+        once the job completes. Jobs are cancelled when the object ends.
+        """
+        return get_registry(self.object.scene).jobs.submit(function, args, self, callback, error_callback)
+
+    @classmethod
+    def update_batch(cls, components):
+        """Update every live instance of this class in a single call.
+
+        Overriding this replaces the per-instance update() calls for the class.
+        """
+        for component in components:
+            component.update()
@@ -0,0 +1,149 @@
+from array import array
+
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+
+class Field:
+    """Numeric component attribute, stored in an array shared by all instances of the component class.
+
+    :param typecode: array module type code of the values
+    :param default: initial value
+    """
+
+    def __init__(self, typecode='d', default=0):
+        self.typecode = typecode
+        self.default = default
+        self.name = None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return get_store(owner).columns[self.name][instance._store_index]
+
+    def __set__(self, instance, value):
+        get_store(instance.__class__).columns[self.name][instance._store_index] = value
+
+
+def get_fields(cls):
+    """Return the Fields declared by a class and its bases, by name"""
+    fields = {}
+
+    for base in reversed(cls.__mro__):
+        for name, value in vars(base).items():
+            if isinstance(value, Field):
+                value.name = name
+                fields[name] = value
+
+    return fields
+
+
+def make_column(typecode, default, capacity):
+    if numpy is not None:
+        column = numpy.empty(capacity, dtype=typecode)
+        column.fill(default)
+        return column
+
+    return array(typecode, [default]) * capacity
+
+
+def grow_column(column, typecode, default, capacity):
+    """Return a copy of a column with a greater capacity"""
+    new_column = make_column(typecode, default, capacity)
+    new_column[:len(column)] = column
+    return new_column
+
+
+class ComponentStore:
+    """Struct-of-arrays storage of the Fields of a component class.
+
+    Each Field has a column holding the values of every instance, in the same order as `components`. Only the first
+    `count` entries of a column are in use; `get_column()` returns a view of these.
+    """
+
+    def __init__(self, cls, initial_capacity=16):
+        self.cls = cls
+        self.fields = get_fields(cls)
+        self.components = []
+        self.capacity = initial_capacity
+        self.columns = {name: make_column(field.typecode, field.default, initial_capacity)
+                        for name, field in self.fields.items()}
+
+    @property
+    def count(self):
+        return len(self.components)
+
+    def get_column(self, name):
+        column = self.columns[name]
+        if numpy is not None:
+            return column[:self.count]
+
+        return memoryview(column)[:self.count]
+
+    def _grow(self):
+        self.capacity *= 2
+
+        for name, field in self.fields.items():
+            self.columns[name] = grow_column(self.columns[name], field.typecode, field.default, self.capacity)
+
+    def add(self, component):
+        index = len(self.components)
+        if index == self.capacity:
+            self._grow()
+
+        for name, field in self.fields.items():
+            self.columns[name][index] = field.default
+
+        component._store_index = index
+        self.components.append(component)
+
+    def remove(self, component):
+        """Remove a component, moving the last component into its place"""
+        index = component._store_index
+        last_index = len(self.components) - 1
+        last_component = self.components.pop()
+
+        if index != last_index:
+            for column in self.columns.values():
+                column[index] = column[last_index]
+
+            self.components[index] = last_component
+            last_component._store_index = index
+
+        component._store_index = -1
+
+
+_stores = {}
+
+
+def get_store(cls):
+    try:
+        return _stores[cls]
+
+    except KeyError:
+        store = _stores[cls] = ComponentStore(cls)
+        return store
+
+
+_has_fields = {}
+
+
+def has_fields(cls):
+    try:
+        return _has_fields[cls]
+
+    except KeyError:
+        result = _has_fields[cls] = bool(get_fields(cls))
+        return result
+
+
+def remove_components(components):
+    """Remove the components with Fields from the stores of their classes"""
+    for component in components:
+        cls = component.__class__
+        if has_fields(cls):
+            get_store(cls).remove(component)
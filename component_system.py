@@ -1,13 +1,39 @@
 from bge import logic, types
-from common import load_component_class, group_component_args, from_json_string
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import MutableMapping
+from copy import copy
+from heapq import heappush, heappop
+from itertools import compress
+from logging import getLogger
+from time import perf_counter
+from uuid import uuid4
+from common import load_component_class, get_component_schema, decode_value
+from component_store import has_fields, get_store, remove_components
+from compute_pool import ComputeStage
+from coroutines import TaskLoop
+from jobs import JobQueue
+from lifecycle import leak_tracker
+from message_bus import MessageBus
+from profiling import profiler
+from spatial_lod import LevelOfDetail
+from wake_queue import WakeQueue, seconds_to_ticks
 
 
 # Create fake base class
-from component_base import KX_PythonComponent
+import component_base
+from component_base import KX_PythonComponent, PHASES, PHASE_DEFAULT, PRIORITY_LOW
 types.KX_PythonComponent = KX_PythonComponent
 
 
 COMPONENTS_NAME = "components"
+REGISTRY_NAME = "component_registry"
+PENDING_NAME = "components_pending"
+
+# Scene properties controlling how often its components are updated
+TICK_RATE_NAME = "component_tick_rate"
+SUSPENDED_NAME = "components_suspended"
+
+logger = getLogger(__name__)
 
 
 def any_positive(sensors):
@@ -18,32 +44,223 @@ def any_positive(sensors):
     return False
 
 
+# Argument values which can be shared between components without being copied
+IMMUTABLE_ARG_TYPES = str, int, float, bool, type(None), tuple, frozenset
+
+
+class ComponentArgs(MutableMapping):
+    """Copy-on-write view of an argument dictionary shared between components.
+
+    Mutable values (e.g. Vectors) are copied into the view the first time they are read, and assigned values are kept
+    by the view, so that modifying values doesn't affect other components. Only deleting an argument copies the whole
+    dictionary.
+    """
+
+    __slots__ = "_args", "_mutable_names", "_overlay"
+
+    def __init__(self, args, mutable_names=frozenset()):
+        self._args = args
+        self._mutable_names = mutable_names
+
+        # Values copied or assigned by this view, or None
+        self._overlay = None
+
+    def __getitem__(self, name):
+        overlay = self._overlay
+        if overlay is not None and name in overlay:
+            return overlay[name]
+
+        value = self._args[name]
+        if name in self._mutable_names:
+            value = copy(value)
+
+            if overlay is None:
+                overlay = self._overlay = {}
+
+            overlay[name] = value
+
+        return value
+
+    def __setitem__(self, name, value):
+        if self._overlay is None:
+            self._overlay = {}
+
+        self._overlay[name] = value
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+
+        self._args = self.copy()
+        self._mutable_names = frozenset()
+        self._overlay = None
+        del self._args[name]
+
+    def __contains__(self, name):
+        return name in self._args or (self._overlay is not None and name in self._overlay)
+
+    def __iter__(self):
+        yield from self._args
+
+        if self._overlay is not None:
+            args = self._args
+            for name in self._overlay:
+                if name not in args:
+                    yield name
+
+    def __len__(self):
+        if self._overlay is None:
+            return len(self._args)
+
+        args = self._args
+        return len(args) + sum(1 for name in self._overlay if name not in args)
+
+    def copy(self):
+        """Return an ordered dictionary of the arguments, whose mutable values are this view's copies"""
+        return OrderedDict(self.items())
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, dict(self.items()))
+
+
+_interned_args = {}
+
+
 def create_args_dict(component_cls, raw_component_args):
+    """Return the decoded arguments of a component, shared with components of the same class and raw arguments"""
+    key = component_cls, tuple(raw_component_args.items())
+
     try:
-        base_args = component_cls.args.copy()
+        args, mutable_names = _interned_args[key]
+
+    except KeyError:
+        try:
+            args = OrderedDict(component_cls.args)
+
+        except AttributeError:
+            args = OrderedDict()
+
+        args.update((k, decode_value(v)) for k, v in raw_component_args.items())
+        mutable_names = frozenset(k for k, v in args.items() if not isinstance(v, IMMUTABLE_ARG_TYPES))
+        _interned_args[key] = args, mutable_names
+
+    return ComponentArgs(args, mutable_names)
+
+
+def clear_interned_args():
+    _interned_args.clear()
+
+
+class ComponentPools:
+    """Pools of components whose objects have ended, for reuse by spawned objects.
+
+    Classes opt in by declaring a positive pool_size, which set_size() overrides.
+    """
+
+    def __init__(self):
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+        self._pools = defaultdict(deque)
+        self._sizes = {}
 
-    except AttributeError:
-        base_args = {}
+    def get_size(self, cls):
+        try:
+            return self._sizes[cls]
 
-    component_args = {k: from_json_string(v) for k, v in raw_component_args.items()}
-    base_args.update(component_args)
-    return base_args
+        except KeyError:
+            return cls.pool_size
+
+    def set_size(self, cls, size):
+        self._sizes[cls] = size
+
+        pool = self._pools[cls]
+        while len(pool) > size:
+            pool.pop()
+
+    def acquire(self, cls):
+        """Return a pooled component of a class, or None if there isn't one"""
+        if not self.get_size(cls):
+            return None
+
+        pool = self._pools[cls]
+        if not pool:
+            self.misses[cls] += 1
+            return None
+
+        self.hits[cls] += 1
+        return pool.pop()
+
+    def release(self, components):
+        """Return the components of an ended object to their pools, if they have room"""
+        for component in components:
+            cls = component.__class__
+
+            size = self.get_size(cls)
+            if not size:
+                continue
+
+            pool = self._pools[cls]
+            if len(pool) < size:
+                component.object = None
+                pool.append(component)
+
+    def get_pooled_components(self):
+        return [component for pool in self._pools.values() for component in pool]
+
+    def get_statistics(self):
+        """Return a mapping of pooled class to (pool length, hits, misses)"""
+        return {cls: (len(pool), self.hits[cls], self.misses[cls]) for cls, pool in self._pools.items()}
+
+    def clear(self):
+        self._pools.clear()
+
+
+component_pools = ComponentPools()
 
 
 def init_components(obj):
-    components = []
+    if profiler.enabled:
+        start_time = perf_counter()
+        components = _init_components(obj)
+        profiler.add_init(perf_counter() - start_time)
+        return components
+
+    return _init_components(obj)
 
-    # Load properties from object
-    prop_dict = {k: obj[k] for k in obj.getPropertyNames()}
 
-    component_data = group_component_args(prop_dict)
-    for import_path, raw_component_args in component_data.items():
+def _init_components(obj):
+    components = []
+
+    for import_path, arg_names in get_component_schema(obj.getPropertyNames()):
         cls = load_component_class(import_path)
 
+        raw_component_args = {arg_name: obj[prop_name] for arg_name, prop_name in arg_names}
+
         args = create_args_dict(cls, raw_component_args)
 
-        component = cls(obj)
-        component.start(args)
+        component = component_pools.acquire(cls)
+        if component is None:
+            component = cls(obj)
+            start = component.start
+
+        else:
+            component.object = obj
+            start = component.reset
+
+        if has_fields(cls):
+            get_store(cls).add(component)
+
+        if leak_tracker.enabled:
+            leak_tracker.track(component)
+
+        if profiler.enabled:
+            start_time = perf_counter()
+            start(args)
+            profiler.get_class_statistics(cls).add_start(perf_counter() - start_time)
+
+        else:
+            start(args)
 
         components.append(component)
 
@@ -62,13 +279,956 @@ def update_from_controller(cont):
     own = cont.owner
     scene = own.scene
 
+    frame_budget.begin_tick()
     update_scene(scene)
+    end_tick()
+
+
+class FrameBudget:
+    """Time budget for the component updates of a logic tick.
+
+    Low priority components are only updated whilst the budget is not exhausted, except that one is always updated per
+    tick, and each is guaranteed an update at least every `max_starvation` ticks.
+
+    :param budget: budget in milliseconds, or None for no budget
+    :param max_starvation: maximum number of ticks a low priority component may go without an update
+    """
+
+    def __init__(self, budget=None, max_starvation=30):
+        self.budget = budget
+        self.max_starvation = max_starvation
+
+        self.tick = 0
+        self.deferred = 0
+        self.deferred_history = deque(maxlen=120)
+
+        self._deadline = None
+
+    def begin_tick(self):
+        if self.tick:
+            self.deferred_history.append(self.deferred)
+
+        self.tick += 1
+        self.deferred = 0
+
+        budget = self.budget
+        self._deadline = None if budget is None else perf_counter() + budget / 1000
+
+    def exhausted(self):
+        deadline = self._deadline
+        return deadline is not None and perf_counter() >= deadline
+
+
+frame_budget = FrameBudget()
+
+
+class InitBudget:
+    """Time budget for initialising the components of spawned objects each tick.
+
+    Objects over budget stay pending (flagged by the PENDING_NAME property) until a later tick. At least one object is
+    initialised per tick.
+
+    :param budget: budget in milliseconds, or None to initialise objects as soon as they spawn
+    :param prewarm: initialise every object present when the scene loads, regardless of the budget
+    :param by_distance: initialise pending objects nearest to the active camera first, rather than in spawn order
+    """
+
+    def __init__(self, budget=None, prewarm=True, by_distance=True):
+        self.budget = budget
+        self.prewarm = prewarm
+        self.by_distance = by_distance
+
+
+init_budget = InitBudget()
+
+
+class SceneSchedule:
+    """Decide on which logic ticks a scene's components are updated, and record how long its updates take.
+
+    The tick rate (ticks per second) and suspension are read from the TICK_RATE_NAME and SUSPENDED_NAME scene
+    properties, so that e.g. a HUD overlay can be updated less often than the gameplay scene. A scene is updated at most
+    once per logic tick, so rates above the logic tick rate have no effect, and invalid rates are logged and ignored.
+    Suspended scenes are not updated at all.
+
+    :param history: number of update times kept for statistics
+    """
+
+    def __init__(self, history=120):
+        self.tick_rate = None
+        self.suspended = False
+
+        self.updates = 0
+        self.skipped = 0
+        self.suspended_ticks = 0
+        self.times = deque(maxlen=history)
+
+        self._elapsed = 0.0
+        self._invalid_tick_rate = None
+
+    def read_settings(self, scene):
+        """Read the scene properties, returning True if the tick rate changed"""
+        self.suspended = bool(scene.get(SUSPENDED_NAME, False)) or scene.suspended
+
+        tick_rate = scene.get(TICK_RATE_NAME)
+        if tick_rate is not None:
+            try:
+                valid = tick_rate > 0
+
+            except TypeError:
+                valid = False
+
+            if not valid:
+                # Log each invalid value once, and update the scene every tick instead
+                if tick_rate != self._invalid_tick_rate:
+                    logger.error("Invalid {} {!r} for scene {!r}: expected a positive number"
+                                 .format(TICK_RATE_NAME, tick_rate, scene.name))
+                    self._invalid_tick_rate = tick_rate
+
+                tick_rate = None
+
+            elif tick_rate >= logic.getLogicTicRate():
+                tick_rate = None
+
+            else:
+                tick_rate = float(tick_rate)
+
+        if tick_rate == self.tick_rate:
+            return False
+
+        self.tick_rate = tick_rate
+        self._elapsed = 0.0
+        return True
+
+    def due(self, dt):
+        """Advance the scene clock by dt seconds, returning True if the scene should be updated this tick"""
+        if self.suspended:
+            self.suspended_ticks += 1
+            return False
+
+        tick_rate = self.tick_rate
+        if tick_rate is None:
+            return True
+
+        period = 1 / tick_rate
+        self._elapsed += dt
+        if self._elapsed < period:
+            self.skipped += 1
+            return False
+
+        # Carry over less than a period minus this tick, so a slow frame doesn't cause updates on consecutive ticks
+        self._elapsed = min(self._elapsed - period, max(period - dt, 0.0))
+        return True
+
+    def add_time(self, duration):
+        self.updates += 1
+        self.times.append(duration)
+
+    def get_statistics(self):
+        """Return a dict of update counts and update times in milliseconds"""
+        times = self.times
+        return {
+            "tick_rate": self.tick_rate,
+            "suspended": self.suspended,
+            "updates": self.updates,
+            "skipped": self.skipped,
+            "suspended_ticks": self.suspended_ticks,
+            "mean_ms": sum(times) / len(times) * 1000 if times else 0.0,
+            "max_ms": max(times) * 1000 if times else 0.0,
+        }
+
+
+class DeferredUpdates:
+    """Round-robin queue of low priority updates.
+
+    Each update becomes due once its interval has passed since it last ran, and then runs on the first tick with
+    budget to spare.
+    """
+
+    def __init__(self):
+        self.updates = []
+        self.keys = []
+        self.intervals = []
+        self.last_update_ticks = []
+        self.active = []
+
+        self._cursor = 0
+
+    def rebuild(self, keys, updates, intervals, tick):
+        """Replace the queued updates, keeping the last update tick of those which remain"""
+        last_update_ticks = dict(zip(self.keys, self.last_update_ticks))
+
+        self.keys = keys
+        self.updates = updates
+        self.intervals = intervals
+        self.active = [True] * len(updates)
+
+        # New updates are due immediately
+        self.last_update_ticks = [last_update_ticks.get(key, tick - interval)
+                                  for key, interval in zip(keys, intervals)]
+
+        # Resume from the update which has waited longest
+        waits = [tick - last_tick - interval for last_tick, interval in zip(self.last_update_ticks, intervals)]
+        self._cursor = waits.index(max(waits)) if waits else 0
+
+    def set_active(self, index, active):
+        """Include or exclude (e.g. whilst its component sleeps) an update, keeping its place in the queue"""
+        self.active[index] = active
+
+    def get_starvation(self, tick):
+        """Return the greatest number of ticks any update has waited since it became due"""
+        waits = [tick - last_tick - interval + 1
+                 for last_tick, interval, active in zip(self.last_update_ticks, self.intervals, self.active) if active]
+        return max(0, max(waits)) if waits else 0
+
+    def run(self, budget):
+        updates = self.updates
+        count = len(updates)
+        if not count:
+            return
+
+        intervals = self.intervals
+        last_update_ticks = self.last_update_ticks
+        active = self.active
+        tick = budget.tick
+        max_starvation = budget.max_starvation
+
+        cursor = self._cursor
+        next_cursor = None
+        updated = 0
+        postponed = 0
+
+        for _ in range(count):
+            waited = tick - last_update_ticks[cursor] - intervals[cursor] + 1
+            if waited > 0 and active[cursor]:
+                # At least one due update is made per tick, and those which have waited too long are always made
+                if updated and waited < max_starvation and budget.exhausted():
+                    if next_cursor is None:
+                        next_cursor = cursor
+
+                    postponed += 1
+
+                else:
+                    updates[cursor]()
+                    last_update_ticks[cursor] = tick
+                    updated += 1
+
+            cursor += 1
+            if cursor == count:
+                cursor = 0
+
+        # Resume from the first postponed update
+        self._cursor = cursor if next_cursor is None else next_cursor
+        budget.deferred += postponed
+
+
+def overrides_update_batch(cls):
+    return cls.update_batch.__func__ is not KX_PythonComponent.update_batch.__func__
+
+
+def make_batch_update(cls, batch):
+    """Return a function which updates a batch of components of a class, unless the batch is empty"""
+    update_batch = cls.update_batch
+
+    def update():
+        if batch:
+            update_batch(batch)
+
+    return update
+
+
+def get_update_interval(component, tick_rate=None):
+    """Return the number of ticks between updates of a component"""
+    period = component.update_period
+    if period is not None:
+        return seconds_to_ticks(period, tick_rate)
+
+    return max(1, component.update_interval)
+
+
+class UpdatePipeline:
+    """Flat arrays of bound update methods, ordered by phase.
+
+    Classes which override update_batch() are dispatched once per phase with all of their instances, at the position
+    of their first instance. Components updated less often than every tick (or throttled by their distance band, see
+    spatial_lod) are staggered across the ticks of their interval. Thread-safe components are computed on a thread
+    pool whilst the phases run, and their results are committed afterwards, instead of being updated. Dormant components
+    are left out.
+
+    The arrays are rebuilt only after the set of components changes, when components change distance band, or when
+    profiling is toggled. Sleeping components are removed from (and on waking, returned to their position in) the arrays
+    they were placed in, at the start of the next run.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self.deferred = DeferredUpdates()
+        self.compute_stage = ComputeStage()
+        self.dirty = True
+        self.profiled = False
+        self.tick = 0
+
+        self._slots = {}
+        self._invalid_phase_classes = set()
+
+        # The (container, item) pairs of each component, where item is the position of the component in the container's
+        # members (or its index in deferred), the items and placed flags of each container by id, sleeping components,
+        # and pending sleep changes
+        self._placements = {}
+        self._members = {}
+        self._asleep = set()
+        self._sleep_changes = []
+
+    def invalidate(self):
+        self.dirty = True
+
+    def set_sleeping(self, component, sleeping):
+        """Remove a component from, or return it to, the pipeline at the start of the next run"""
+        self._sleep_changes.append((component, sleeping))
+
+    def _set_placed(self, component, placed, changed):
+        """Activate or deactivate the deferred updates of a component, and record its other containers in changed"""
+        deferred = self.deferred
+
+        for container, item in self._placements[component]:
+            if container is deferred:
+                deferred.set_active(item, placed)
+
+            else:
+                container_id = id(container)
+                self._members[container_id][1][item] = placed
+                changed[container_id] = container
+
+    def _apply_sleep_changes(self):
+        asleep = self._asleep
+        changed = {}
+
+        for component, sleeping in self._sleep_changes:
+            # Components placed by a later build, or since removed, don't need changing
+            if component not in self._placements or (component in asleep) == sleeping:
+                continue
+
+            if sleeping:
+                asleep.add(component)
+
+            else:
+                asleep.discard(component)
+
+            self._set_placed(component, not sleeping, changed)
+
+        self._sleep_changes.clear()
+
+        # Refill each changed container once from its members, which returns woken components to their position
+        members = self._members
+        for container_id, container in changed.items():
+            container[:] = compress(*members[container_id])
+
+    def _get_slot_loads(self):
+        """Return the number of components assigned to each slot of each interval by the last build"""
+        slot_loads = {}
+        for (component_id, interval), slot in self._slots.items():
+            try:
+                loads = slot_loads[interval]
+
+            except KeyError:
+                loads = slot_loads[interval] = [0] * interval
+
+            loads[slot] += 1
+
+        return slot_loads
+
+    def _get_slot(self, component, interval, slots, slot_loads):
+        """Return the tick (modulo interval) on which to update a component.
+
+        Components keep their previous slot, and new components are given the least loaded slot of their interval.
+        """
+        key = id(component), interval
+
+        try:
+            slot = self._slots[key]
+
+        except KeyError:
+            try:
+                loads = slot_loads[interval]
+
+            except KeyError:
+                loads = slot_loads[interval] = [0] * interval
+
+            slot = loads.index(min(loads))
+            loads[slot] += 1
+
+        slots[key] = slot
+        return slot
+
+    def _finalise(self, entries):
+        if profiler.enabled:
+            return [profiler.instrument_update(cls, update, len(batch) if batch else 1)
+                    for cls, update, batch, component in entries]
+
+        return [update for cls, update, batch, component in entries]
+
+    def _place(self, entries, placements, members, sleeping):
+        """Return the finalised updates of entries, recording the placement of those of single components"""
+        updates = []
+
+        for (cls, update, batch, component), finalised in zip(entries, self._finalise(entries)):
+            self._add_placed(updates, finalised, component, placements, members, sleeping)
+
+        return updates
+
+    def _add_to_batch(self, batches, key, cls, component, placements, members, sleeping):
+        """Add a component to the batch of a key, returning the entry of the batch if it is new"""
+        try:
+            batch = batches[key]
+            entry = None
+
+        except KeyError:
+            batch = batches[key] = []
+            entry = cls, make_batch_update(cls, batch), batch, None
+
+        self._add_placed(batch, component, component, placements, members, sleeping)
+        return entry
+
+    @staticmethod
+    def _add_placed(container, item, component, placements, members, sleeping):
+        """Add an item to a container, unless its component sleeps, recording its position among the container's
+        members so that it can be returned there.
+        """
+        try:
+            items, flags = members[id(container)]
+
+        except KeyError:
+            items, flags = members[id(container)] = [], []
+
+        if component is not None:
+            placements[component].append((container, len(items)))
+
+        placed = component not in sleeping
+        items.append(item)
+        flags.append(placed)
+
+        if placed:
+            container.append(item)
+
+    def build(self, component_lists, sleeping=(), lod_intervals=None, tick_rate=None):
+        if lod_intervals is None:
+            lod_intervals = {}
+
+        phases = OrderedDict((phase, OrderedDict()) for phase in PHASES)
+        batches = {}
+        slots = {}
+        slot_loads = self._get_slot_loads()
+
+        deferred_keys = []
+        deferred_entries = []
+        deferred_intervals = []
+        compute_groups = {}
+
+        placements = defaultdict(list)
+        members = {}
+
+        for components in component_lists:
+            for component in components:
+                lod_interval = lod_intervals.get(component)
+                if lod_interval == 0:
+                    continue
+
+                interval = get_update_interval(component, tick_rate)
+                if lod_interval is not None:
+                    interval = max(interval, lod_interval)
+
+                # Thread-safe components are computed and committed instead of updated
+                if component.thread_safe:
+                    slot = self._get_slot(component, interval, slots, slot_loads) if interval > 1 else 0
+                    try:
+                        compute_components = compute_groups[interval, slot]
+
+                    except KeyError:
+                        compute_components = compute_groups[interval, slot] = []
+
+                    self._add_placed(compute_components, component, component, placements, members, sleeping)
+                    continue
+
+                cls = component.__class__
+
+                batched = overrides_update_batch(cls)
+
+                # Skip components which don't override update
+                if not batched and cls.update is KX_PythonComponent.update:
+                    continue
+
+                if component.priority == PRIORITY_LOW:
+                    if not batched:
+                        deferred_keys.append(id(component))
+                        deferred_entries.append((cls, component.update, None, component))
+                        deferred_intervals.append(interval)
+                        continue
+
+                    entry = self._add_to_batch(batches, (cls, PRIORITY_LOW, interval), cls, component, placements,
+                                               members, sleeping)
+                    if entry is not None:
+                        deferred_keys.append((cls, interval))
+                        deferred_entries.append(entry)
+                        deferred_intervals.append(interval)
+
+                    continue
+
+                phase = component.phase
+                try:
+                    groups = phases[phase]
+
+                except KeyError:
+                    # Log each misconfigured class once, and update its components in the default phase instead
+                    if cls not in self._invalid_phase_classes:
+                        logger.error("Invalid phase {!r} for component {!r}: expected one of {}"
+                                     .format(phase, cls.__name__, PHASES))
+                        self._invalid_phase_classes.add(cls)
+
+                    phase = PHASE_DEFAULT
+                    groups = phases[phase]
+
+                slot = self._get_slot(component, interval, slots, slot_loads) if interval > 1 else 0
+
+                try:
+                    entries = groups[interval, slot]
+
+                except KeyError:
+                    entries = groups[interval, slot] = []
+
+                if not batched:
+                    entries.append((cls, component.update, None, component))
+                    continue
+
+                entry = self._add_to_batch(batches, (cls, phase, interval, slot), cls, component, placements,
+                                           members, sleeping)
+                if entry is not None:
+                    entries.append(entry)
+
+        self.phases = []
+        for groups in phases.values():
+            every_tick = self._place(groups.pop((1, 0), ()), placements, members, sleeping)
+
+            wheels = OrderedDict()
+            for (interval, slot), entries in sorted(groups.items()):
+                try:
+                    wheel = wheels[interval]
+
+                except KeyError:
+                    wheel = wheels[interval] = [[] for _ in range(interval)]
+
+                wheel[slot] = self._place(entries, placements, members, sleeping)
+
+            self.phases.append((every_tick, list(wheels.items())))
+
+        deferred = self.deferred
+        deferred.rebuild(deferred_keys, self._finalise(deferred_entries), deferred_intervals, frame_budget.tick)
+        for index, (cls, update, batch, component) in enumerate(deferred_entries):
+            if component is not None:
+                placements[component].append((deferred, index))
+                if component in sleeping:
+                    deferred.set_active(index, False)
+
+        compute_every_tick = compute_groups.pop((1, 0), [])
+        compute_wheels = OrderedDict()
+        for (interval, slot), compute_components in sorted(compute_groups.items()):
+            try:
+                wheel = compute_wheels[interval]
+
+            except KeyError:
+                wheel = compute_wheels[interval] = [[] for _ in range(interval)]
+
+            wheel[slot] = compute_components
+
+        self.compute_stage.set_components(compute_every_tick, list(compute_wheels.items()))
+
+        self._slots = slots
+        self._placements = placements
+        self._members = members
+        self._asleep = {component for component in placements if component in sleeping}
+        self._sleep_changes.clear()
+        self.dirty = False
+        self.profiled = profiler.enabled
+
+    def run(self):
+        if self._sleep_changes:
+            self._apply_sleep_changes()
+
+        tick = self.tick
+        self.tick = tick + 1
+
+        compute_stage = self.compute_stage
+        compute_stage.submit(tick)
+
+        for updates, wheels in self.phases:
+            for update in updates:
+                update()
+
+            for interval, wheel in wheels:
+                for update in wheel[tick % interval]:
+                    update()
+
+        compute_stage.commit()
+        self.deferred.run(frame_budget)
+
+
+class ComponentIndex:
+    """Live components of a scene by class"""
+
+    def __init__(self):
+        self._by_class = defaultdict(OrderedDict)
+
+    def add(self, components):
+        for component in components:
+            self._by_class[component.__class__][component] = None
+
+    def remove(self, components):
+        by_class = self._by_class
+
+        for component in components:
+            cls = component.__class__
+            instances = by_class[cls]
+            del instances[component]
+
+            if not instances:
+                del by_class[cls]
+
+    def get_components(self, cls):
+        """Return the live components which are instances of a class (including its subclasses)"""
+        components = []
+
+        for component_cls, instances in self._by_class.items():
+            if issubclass(component_cls, cls):
+                components.extend(instances)
+
+        return components
+
+    def count(self, cls):
+        return sum(len(instances) for component_cls, instances in self._by_class.items()
+                   if issubclass(component_cls, cls))
+
+
+class ComponentRegistry:
+    """Track the component-bearing objects of a scene.
+
+    The engine appends spawned objects to the end of the scene object list and keeps the order of the remaining
+    objects when others end, so the list only needs to be inspected when its length or last object changes.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.components = OrderedDict()
+        self.pipeline = UpdatePipeline()
+        self.wake_queue = WakeQueue(self._on_sleep_changed)
+        self.tasks = TaskLoop()
+        self.jobs = JobQueue()
+        self.lod = LevelOfDetail()
+        self.index = ComponentIndex()
+        self.messages = MessageBus()
+        self.schedule = SceneSchedule()
+
+        self.pending_count = 0
+
+        # Serial numbers of the objects with components, in the order they were initialised, which identify objects in
+        # snapshots (see snapshot) taken of this registry, itself identified by its random token
+        self.serial_numbers = {}
+        self.token = uuid4().int & 0xFFFFFFFFFFFFFFFF
+        self._next_serial = 0
+
+        self._seen = set()
+        self._object_count = 0
+        self._last_object = None
+        self._loaded = False
+        self._pending = []
+        self._pending_order = 0
+
+    @property
+    def tick_rate(self):
+        """Ticks per second at which the scene is updated, or None for the logic tick rate"""
+        return self.schedule.tick_rate
+
+    def read_schedule(self):
+        """Apply the scheduling properties of the scene"""
+        if self.schedule.read_settings(self.scene):
+            # Update periods and durations in seconds convert to a different number of ticks
+            self.tasks.tick_rate = self.schedule.tick_rate
+            self.pipeline.invalidate()
+
+    def sleep_component(self, component, duration=None, events=(), messages=False):
+        """Stop updating a component until woken (see KX_PythonComponent.sleep)"""
+        ticks = None if duration is None else seconds_to_ticks(duration, self.tick_rate)
+        self.wake_queue.sleep(component, ticks, events, messages)
+
+    def _on_sleep_changed(self, component, sleeping):
+        self.pipeline.set_sleeping(component, sleeping)
+
+    def _objects_changed(self, objects):
+        count = len(objects)
+        if count != self._object_count:
+            return True
+
+        return bool(count) and objects[-1] is not self._last_object
+
+    def _find_new_objects(self, objects):
+        """Walk back from the end of the object list until a previously seen object is found"""
+        seen = self._seen
+        new_objects = []
+
+        for index in range(len(objects) - 1, -1, -1):
+            obj = objects[index]
+            if obj in seen:
+                break
+
+            new_objects.append(obj)
+
+        new_objects.reverse()
+        seen.update(new_objects)
+        return new_objects
+
+    def _remove_ended_objects(self, objects):
+        components = self.components
+
+        ended_objects = [o for o in components if o.invalid]
+        for obj in ended_objects:
+            self._dispose_components(obj, components.pop(obj))
+
+        if ended_objects:
+            self.pipeline.invalidate()
+
+        # Forget ended objects once they outnumber the live ones
+        if len(self._seen) > 2 * len(objects):
+            self._seen = set(objects)
+
+    def _dispose_components(self, obj, components):
+        """Call the dispose() hooks of an object's components, and release them from the runtime"""
+        for component in components:
+            try:
+                component.dispose()
+
+            except Exception:
+                logger.exception("Unable to dispose {!r}".format(component))
+
+            leak_tracker.mark_disposed(component)
+
+        self.serial_numbers.pop(obj, None)
+        self.index.remove(components)
+        self.wake_queue.forget(components)
+        self.tasks.forget(components)
+        self.jobs.forget(components)
+        self.messages.forget(components)
+        self.lod.remove(obj, components)
+        remove_components(components)
+        component_pools.release(components)
+
+    def dispose(self):
+        """Dispose of every component, e.g. when the scene is removed"""
+        components = self.components
+        while components:
+            obj, object_components = components.popitem()
+            self._dispose_components(obj, object_components)
+
+        self._pending.clear()
+        self.pending_count = 0
+        self.pipeline.invalidate()
+
+    def _add_components(self, obj, components):
+        if components:
+            self.components[obj] = components
+            self.serial_numbers[obj] = self._next_serial
+            self._next_serial += 1
+            self.index.add(components)
+            self.lod.add(obj, components)
+            self.pipeline.invalidate()
+
+    def _initialise(self, obj):
+        try:
+            components = init_components(obj)
+
+        except Exception:
+            # Don't retry misconfigured objects, nor lose the other spawned objects
+            logger.exception("Unable to initialise components of {!r}".format(obj.name))
+            components = []
+
+        obj[COMPONENTS_NAME] = components
+        self._add_components(obj, components)
+
+    def _add_pending(self, obj):
+        if init_budget.by_distance:
+            priority = obj.getDistanceTo(self.scene.active_camera)
+
+        else:
+            priority = 0.0
+
+        self._pending_order += 1
+        heappush(self._pending, (priority, self._pending_order, obj))
+
+        obj[PENDING_NAME] = True
+        self.pending_count += 1
+
+    def initialise_pending(self, budget=None):
+        """Initialise pending objects, whilst the budget (in milliseconds) allows, or all of them if it is None"""
+        pending = self._pending
+        if not pending:
+            return
+
+        deadline = None if budget is None else perf_counter() + budget / 1000
+        initialised = 0
+
+        while pending:
+            if initialised and deadline is not None and perf_counter() >= deadline:
+                break
+
+            priority, order, obj = heappop(pending)
+            self.pending_count -= 1
+
+            if obj.invalid:
+                continue
+
+            del obj[PENDING_NAME]
+            self._initialise(obj)
+            initialised += 1
+
+    def refresh(self):
+        """Find spawned objects and forget ended ones, then initialise pending objects within the init budget"""
+        objects = self.scene.objects
+
+        if self._objects_changed(objects):
+            new_objects = self._find_new_objects(objects)
+            self._remove_ended_objects(objects)
+
+            # Initialise everything present at scene load when prewarming
+            defer = init_budget.budget is not None and not (init_budget.prewarm and not self._loaded)
+
+            for obj in new_objects:
+                try:
+                    components = obj[COMPONENTS_NAME]
+
+                except KeyError:
+                    if not defer:
+                        self._initialise(obj)
+
+                    # Only objects with components are worth queueing
+                    elif get_component_schema(obj.getPropertyNames()):
+                        self._add_pending(obj)
+
+                    else:
+                        obj[COMPONENTS_NAME] = []
+
+                else:
+                    self._add_components(obj, components)
+
+            self._object_count = len(objects)
+            self._last_object = objects[-1] if objects else None
+
+        self._loaded = True
+        self.initialise_pending(init_budget.budget)
+
+
+_registries = []
+
+
+def get_registry(scene):
+    try:
+        return scene[REGISTRY_NAME]
+
+    except KeyError:
+        registry = scene[REGISTRY_NAME] = ComponentRegistry(scene)
+        _registries.append(registry)
+        return registry
+
+
+component_base.get_registry = get_registry
+
+def dispose_ended_scenes():
+    """Dispose of the components of removed scenes"""
+    for registry in [r for r in _registries if r.scene.invalid]:
+        registry.dispose()
+        _registries.remove(registry)
+
+
+def dispose_all():
+    """Dispose of the components of every scene, e.g. when the game exits"""
+    for registry in _registries:
+        registry.dispose()
+
+    _registries.clear()
+
+
+def end_tick():
+    """Finish a logic tick, after every scene has been updated"""
+    dispose_ended_scenes()
+
+    if profiler.enabled:
+        profiler.end_tick()
+
+    if leak_tracker.enabled:
+        leak_tracker.end_tick(component_pools.get_pooled_components())
+
+
+def get_components(cls, scene=None):
+    """Return the live components which are instances of a class, in one scene or (if None) every scene"""
+    if scene is not None:
+        return get_registry(scene).index.get_components(cls)
+
+    components = []
+    for scene in logic.getSceneList():
+        registry = scene.get(REGISTRY_NAME)
+        if registry is not None:
+            components.extend(registry.index.get_components(cls))
+
+    return components
+
+
+def get_component(obj, cls):
+    """Return the first live component of an object which is an instance of a class, or None"""
+    for component in get_registry(obj.scene).components.get(obj, ()):
+        if isinstance(component, cls):
+            return component
+
+    return None
+
+
+def update_scenes(scenes, dt=None):
+    """Update the components of each scene which is due an update this tick, according to its schedule.
+
+    :param scenes: scenes to update, e.g. logic.getSceneList()
+    :param dt: seconds since the last logic tick, or None for one logic tick
+    """
+    if dt is None:
+        dt = 1 / logic.getLogicTicRate()
+
+    for scene in scenes:
+        registry = get_registry(scene)
+        registry.read_schedule()
+
+        schedule = registry.schedule
+        if not schedule.due(dt):
+            continue
+
+        start_time = perf_counter()
+        update_scene(scene)
+        schedule.add_time(perf_counter() - start_time)
+
+
+def get_scene_statistics():
+    """Return the schedule statistics of each scene, by scene name"""
+    return {r.scene.name: r.schedule.get_statistics() for r in _registries if not r.scene.invalid}
 
 
 def update_scene(scene):
-    for obj in scene.objects:
-        if COMPONENTS_NAME not in obj:
-            obj[COMPONENTS_NAME] = init_components(obj)
+    registry = get_registry(scene)
+    registry.refresh()
+    registry.wake_queue.update()
+    registry.jobs.update()
+
+    pipeline = registry.pipeline
+    if registry.lod.update(scene):
+        pipeline.invalidate()
+
+    if pipeline.dirty or pipeline.profiled is not profiler.enabled:
+        pipeline.build(registry.components.values(), registry.wake_queue.sleeping, registry.lod.intervals,
+                       registry.tick_rate)
+
+    pipeline.run()
 
-        components = obj[COMPONENTS_NAME]
-        update_components(components)
+    # Messages published by updates are delivered once they have all run
+    registry.messages.deliver()
+    registry.tasks.run()
@@ -21,21 +21,37 @@ class ThirdPerson(bge.types.KX_PythonComponent):
         self.move_speed = args['Move Speed']
         self.turn_speed = args['Turn Speed']
 
-    def update(self):
+    @staticmethod
+    def read_input():
+        """Return the (move, turn) directions requested by the keyboard"""
         keyboard = bge.logic.keyboard.events
 
         move = 0
-        rotate = 0
+        turn = 0
 
         if keyboard[bge.events.WKEY]:
-            move += self.move_speed
+            move += 1
         if keyboard[bge.events.SKEY]:
-            move -= self.move_speed
+            move -= 1
 
         if keyboard[bge.events.AKEY]:
-            rotate += self.turn_speed
+            turn += 1
         if keyboard[bge.events.DKEY]:
-            rotate -= self.turn_speed
+            turn -= 1
+
+        return move, turn
+
+    def apply_input(self, move, turn):
+        self.object.setLinearVelocity((0, move * self.move_speed, 0), True)
+        self.object.applyRotation((0, 0, turn * self.turn_speed), True)
+
+    def update(self):
+        self.apply_input(*self.read_input())
+
+    @classmethod
+    def update_batch(cls, components):
+        # Read the keyboard once for every instance
+        move, turn = cls.read_input()
 
-        self.object.setLinearVelocity((0, move, 0), True)
-        self.object.applyRotation((0, 0, rotate), True)
+        for component in components:
+            component.apply_input(move, turn)
@@ -0,0 +1,151 @@
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from os import cpu_count
+from sys import exc_info
+from time import perf_counter
+from profiling import profiler
+
+
+logger = getLogger(__name__)
+
+# Number of worker threads, or None to use the number of processors
+max_workers = None
+
+_executor = None
+
+
+def get_worker_count():
+    return max_workers or cpu_count() or 1
+
+
+def get_executor():
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(get_worker_count())
+
+    return _executor
+
+
+def shutdown():
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+def compute_chunk(components, timed=False):
+    """Call compute() of each component.
+
+    Returns the components which raised, with their exception info, and the (class, duration) of each call if timed.
+    """
+    failures = []
+    durations = []
+
+    for component in components:
+        if timed:
+            start_time = perf_counter()
+
+        try:
+            component.compute()
+
+        except Exception:
+            failures.append((component, exc_info()))
+
+        if timed:
+            durations.append((component.__class__, perf_counter() - start_time))
+
+    return failures, durations
+
+
+class ComputeStage:
+    """Run compute() of thread-safe components on a thread pool, and commit() their results on the main thread.
+
+    compute() runs whilst the main thread updates the other components, so it must not use the bge API, nor state
+    that other components modify. Thread-safe components aren't updated, so their own state is only touched by
+    compute() until commit() is called. Components updated less often than every tick are computed on the ticks of
+    their slot (see UpdatePipeline).
+    """
+
+    def __init__(self):
+        self.components = []
+        self.wheels = []
+
+        self._submitted = []
+        self._futures = []
+        self._timed = False
+
+    def set_components(self, components, wheels=()):
+        """Set the components computed every tick, and the (interval, per-slot component lists) of the others.
+
+        The pipeline modifies these lists as components sleep and wake.
+        """
+        self.components = components
+        self.wheels = wheels
+
+    def submit(self, tick):
+        components = self.components
+        if self.wheels:
+            components = components + [component for interval, wheel in self.wheels
+                                       for component in wheel[tick % interval]]
+
+        self._submitted = components
+        if not components:
+            return
+
+        # Split into one chunk per worker to limit the cost of dispatch
+        timed = self._timed = profiler.enabled
+        chunk_count = min(len(components), get_worker_count())
+        executor = get_executor()
+        self._futures = [executor.submit(compute_chunk, components[i::chunk_count], timed)
+                         for i in range(chunk_count)]
+
+    def commit(self):
+        if not self._futures:
+            return
+
+        failed = set()
+        durations = []
+        for future in self._futures:
+            chunk_failures, chunk_durations = future.result()
+            durations.extend(chunk_durations)
+
+            for component, error_info in chunk_failures:
+                logger.error("Error computing {!r}".format(component), exc_info=error_info)
+                failed.add(component)
+
+        self._futures = []
+
+        if self._timed:
+            self._commit_timed(failed, durations)
+
+        else:
+            for component in self._submitted:
+                if component not in failed:
+                    component.commit()
+
+        self._submitted = []
+
+    def _commit_timed(self, failed, durations):
+        """Commit the components which didn't fail, recording the durations of their compute() and commit() calls"""
+        statistics = {}
+
+        def get_statistics(cls):
+            try:
+                return statistics[cls]
+
+            except KeyError:
+                class_statistics = statistics[cls] = profiler.get_class_statistics(cls)
+                return class_statistics
+
+        for cls, elapsed in durations:
+            get_statistics(cls).add_compute(elapsed)
+
+        for component in self._submitted:
+            if component in failed:
+                continue
+
+            start_time = perf_counter()
+            component.commit()
+            get_statistics(component.__class__).add_update(perf_counter() - start_time)
@@ -0,0 +1,182 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from logging import getLogger
+from wake_queue import WakeQueue, seconds_to_ticks
+
+
+logger = getLogger(__name__)
+
+
+class Awaitable(ABC):
+    """Condition a coroutine waits on.
+
+    Supports both `await condition` in `async def` coroutines, and `yield condition` in generators.
+    """
+
+    def __await__(self):
+        yield self
+
+    __iter__ = __await__
+
+    @abstractmethod
+    def schedule(self, loop, task):
+        """Arrange for the loop to resume the task once the condition is met"""
+        pass
+
+
+class NextFrame(Awaitable):
+
+    def schedule(self, loop, task):
+        loop.resume_next_tick(task)
+
+
+class Ticks(Awaitable):
+
+    def __init__(self, count):
+        self.count = count
+
+    def schedule(self, loop, task):
+        loop.wake_queue.sleep(task, ticks=self.count)
+
+
+class Seconds(Awaitable):
+
+    def __init__(self, duration):
+        self.duration = duration
+
+    def schedule(self, loop, task):
+        loop.wake_queue.sleep(task, ticks=seconds_to_ticks(self.duration, loop.tick_rate))
+
+
+class Event(Awaitable):
+
+    def __init__(self, codes):
+        self.codes = codes
+
+    def schedule(self, loop, task):
+        loop.wake_queue.sleep(task, events=self.codes)
+
+
+def next_frame():
+    """Resume on the next tick"""
+    return NextFrame()
+
+
+def ticks(count):
+    """Resume after a number of ticks"""
+    return Ticks(count)
+
+
+def seconds(duration):
+    """Resume after a duration in seconds"""
+    return Seconds(duration)
+
+
+def event(*codes):
+    """Resume once any of the keyboard or mouse event codes is active"""
+    return Event(codes)
+
+
+class Task:
+    """Coroutine run by a TaskLoop"""
+
+    __slots__ = "coroutine", "owner", "done", "cancelled"
+
+    def __init__(self, coroutine, owner=None):
+        self.coroutine = coroutine
+        self.owner = owner
+        self.done = False
+        self.cancelled = False
+
+
+class TaskLoop:
+    """Resume coroutines only once the condition they wait on is ready"""
+
+    def __init__(self):
+        self.wake_queue = WakeQueue(self._on_sleep_changed)
+
+        # Ticks per second at which the loop is run, or None for the logic tick rate
+        self.tick_rate = None
+
+        self._ready = []
+        self._next_ready = []
+        self._owned_tasks = defaultdict(set)
+
+    def _on_sleep_changed(self, task, sleeping):
+        if not sleeping and not task.done:
+            self._next_ready.append(task)
+
+    def resume_next_tick(self, task):
+        self._next_ready.append(task)
+
+    def start(self, coroutine, owner=None):
+        """Run a coroutine (or generator) from the next tick.
+
+        :param coroutine: coroutine or generator which awaits (or yields) Awaitable conditions
+        :param owner: component whose tasks are cancelled when it is forgotten
+        """
+        task = Task(coroutine, owner)
+        self._next_ready.append(task)
+
+        if owner is not None:
+            self._owned_tasks[owner].add(task)
+
+        return task
+
+    def _finish(self, task):
+        task.done = True
+
+        if task.owner is not None:
+            tasks = self._owned_tasks[task.owner]
+            tasks.discard(task)
+            if not tasks:
+                del self._owned_tasks[task.owner]
+
+    def cancel(self, task):
+        if task.done:
+            return
+
+        task.cancelled = True
+        self._finish(task)
+        self.wake_queue.wake(task)
+        task.coroutine.close()
+
+    def forget(self, components):
+        """Cancel the tasks owned by components (e.g. of ended objects)"""
+        for component in components:
+            for task in list(self._owned_tasks.get(component, ())):
+                self.cancel(task)
+
+    def run(self):
+        self.wake_queue.update()
+
+        if not self._next_ready:
+            return
+
+        self._ready, self._next_ready = self._next_ready, self._ready
+
+        for task in self._ready:
+            if task.done:
+                continue
+
+            try:
+                awaitable = task.coroutine.send(None)
+
+            except StopIteration:
+                self._finish(task)
+                continue
+
+            except Exception:
+                logger.exception("Error in coroutine {!r}".format(task.coroutine))
+                self._finish(task)
+                continue
+
+            if not isinstance(awaitable, Awaitable):
+                logger.error("Coroutine {!r} waited on {!r}, which is not an Awaitable"
+                             .format(task.coroutine, awaitable))
+                self.cancel(task)
+                continue
+
+            awaitable.schedule(self, task)
+
+        self._ready.clear()
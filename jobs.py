@@ -0,0 +1,180 @@
+from collections import deque, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+# Number of worker processes, or None to use the number of processors
+max_workers = None
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers)
+
+    return _executor
+
+
+def shutdown():
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def log_error(err):
+    logger.error("Error in job: {!r}".format(err))
+
+
+class Job:
+    """Function call to run in a worker process, whose callback is invoked on the main thread"""
+
+    __slots__ = "function", "args", "owner", "callback", "error_callback", "future", "cancelled"
+
+    def __init__(self, function, args, owner, callback, error_callback):
+        self.function = function
+        self.args = args
+        self.owner = owner
+        self.callback = callback
+        self.error_callback = error_callback
+        self.future = None
+        self.cancelled = False
+
+    @property
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class JobQueue:
+    """Submit jobs to a process pool, and resolve them once per tick.
+
+    At most `max_in_flight` jobs are submitted to the pool at once; further jobs wait in a queue of at most
+    `max_queued` jobs, beyond which submit() raises RuntimeError.
+
+    :param max_in_flight: maximum number of jobs submitted to the pool
+    :param max_queued: maximum number of jobs waiting to be submitted
+    """
+
+    def __init__(self, max_in_flight=32, max_queued=256):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+
+        self.completed_count = 0
+        self.cancelled_count = 0
+
+        self._in_flight = []
+        self._queued = deque()
+        self._owned_jobs = defaultdict(set)
+
+    @property
+    def pending_count(self):
+        return len(self._in_flight) + len(self._queued)
+
+    def submit(self, function, args=(), owner=None, callback=None, error_callback=None):
+        """Run function(*args) in a worker process.
+
+        function and args must be picklable. callback(result) or error_callback(error) is invoked on the main thread
+        once the job completes, unless it was cancelled.
+
+        :param owner: component whose jobs are cancelled when it is forgotten
+        :param error_callback: callable, or None to log errors
+        """
+        if len(self._queued) >= self.max_queued:
+            raise RuntimeError("Unable to submit job: {} jobs are already queued".format(len(self._queued)))
+
+        job = Job(function, args, owner, callback, error_callback or log_error)
+        self._queued.append(job)
+
+        if owner is not None:
+            self._owned_jobs[owner].add(job)
+
+        self._submit_queued()
+        return job
+
+    def _submit_queued(self):
+        queued = self._queued
+        in_flight = self._in_flight
+
+        while queued and len(in_flight) < self.max_in_flight:
+            job = queued.popleft()
+            if job.cancelled:
+                continue
+
+            job.future = get_executor().submit(job.function, *job.args)
+            in_flight.append(job)
+
+    def _release(self, job):
+        if job.owner is not None:
+            jobs = self._owned_jobs[job.owner]
+            jobs.discard(job)
+            if not jobs:
+                del self._owned_jobs[job.owner]
+
+    def cancel(self, job):
+        """Cancel a job; it is removed from the pool if it hasn't started, and its callbacks are never invoked"""
+        if job.cancelled:
+            return
+
+        job.cancelled = True
+        self.cancelled_count += 1
+
+        if job.future is not None:
+            job.future.cancel()
+
+        self._release(job)
+
+    def forget(self, components):
+        """Cancel the jobs owned by components (e.g. of ended objects)"""
+        for component in components:
+            for job in list(self._owned_jobs.get(component, ())):
+                self.cancel(job)
+
+    def update(self):
+        """Invoke the callbacks of completed jobs, and submit queued jobs to the freed workers"""
+        if not self._in_flight:
+            return
+
+        completed = []
+        in_flight = []
+
+        for job in self._in_flight:
+            if job.cancelled:
+                continue
+
+            if job.future.done():
+                completed.append(job)
+
+            else:
+                in_flight.append(job)
+
+        self._in_flight = in_flight
+        self._submit_queued()
+
+        for job in completed:
+            self._release(job)
+            self.completed_count += 1
+
+            try:
+                result = job.future.result()
+
+            except Exception as err:
+                callback, value = job.error_callback, err
+
+            else:
+                callback, value = job.callback, result
+
+            if callback is None:
+                continue
+
+            # An error in one callback mustn't prevent the others from running
+            try:
+                callback(value)
+
+            except Exception:
+                logger.exception("Error in callback {!r} of job {!r}".format(callback, job.function))
@@ -0,0 +1,110 @@
+from collections import OrderedDict, deque
+from json import dump
+from weakref import WeakSet
+
+from profiling import get_class_name
+
+
+class LeakTracker:
+    """Count live components per class over time, using weak references.
+
+    Components which are still alive after being disposed are reported as leaked, unless they are pooled for reuse.
+
+    :param window: number of samples to keep
+    """
+
+    def __init__(self, window=360):
+        self.enabled = False
+        self.history = deque(maxlen=window)
+
+        self.sample_interval = 60
+        self.dump_path = None
+
+        self._components = WeakSet()
+        self._disposed = WeakSet()
+        self._tick = 0
+
+    def enable(self, sample_interval=60, dump_path=None):
+        """Start tracking components created from now on.
+
+        :param sample_interval: ticks between samples of the live component counts
+        :param dump_path: path of file to write the report to after each sample, or None
+        """
+        self.enabled = True
+        self.sample_interval = sample_interval
+        self.dump_path = dump_path
+
+    def disable(self):
+        self.enabled = False
+
+    def track(self, component):
+        self._components.add(component)
+        self._disposed.discard(component)
+
+    def mark_disposed(self, component):
+        if component in self._components:
+            self._disposed.add(component)
+
+    def get_counts(self, pooled=()):
+        """Return an ordered mapping of class name to (live, leaked) counts.
+
+        :param pooled: components intentionally kept alive after disposal
+        """
+        pooled = set(id(c) for c in pooled)
+        counts = OrderedDict()
+
+        for component in list(self._components):
+            name = get_class_name(component.__class__)
+            live, leaked = counts.get(name, (0, 0))
+
+            if component in self._disposed:
+                if id(component) not in pooled:
+                    leaked += 1
+
+            else:
+                live += 1
+
+            counts[name] = live, leaked
+
+        return counts
+
+    def sample(self, tick, pooled=()):
+        self.history.append((tick, self.get_counts(pooled)))
+
+    def end_tick(self, pooled=()):
+        self._tick += 1
+        if self._tick % self.sample_interval:
+            return
+
+        self.sample(self._tick, pooled)
+
+        if self.dump_path is not None:
+            self.dump(self.dump_path)
+
+    def get_growth(self):
+        """Return the change in live and leaked counts of each class between the first and last samples"""
+        if not self.history:
+            return OrderedDict()
+
+        first_tick, first = self.history[0]
+        last_tick, last = self.history[-1]
+
+        growth = OrderedDict()
+        for name, (live, leaked) in last.items():
+            first_live, first_leaked = first.get(name, (0, 0))
+            growth[name] = live - first_live, leaked - first_leaked
+
+        return growth
+
+    def report(self):
+        return OrderedDict((
+            ("samples", [OrderedDict((("tick", tick), ("classes", counts))) for tick, counts in self.history]),
+            ("growth", self.get_growth()),
+        ))
+
+    def dump(self, file_path):
+        with open(file_path, 'w') as f:
+            dump(self.report(), f, indent=4)
+
+
+leak_tracker = LeakTracker()
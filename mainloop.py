@@ -1,26 +1,45 @@
 from bge import logic, events
-from component_system import update_scene
-from time import clock
+from component_system import update_scenes, end_tick, dispose_all, frame_budget, init_budget
+from compute_pool import shutdown as shutdown_compute_pool
+from jobs import shutdown as shutdown_jobs
+from scheduler import Scheduler, set_scheduler, MODE_FIXED
 
-accumulator = 0.0
-dt = 1 / logic.getLogicTicRate()
-last_time = clock()
+# Scheduler configuration, see scheduler.Scheduler
+SCHEDULER_MODE = MODE_FIXED
+MAX_CATCH_UP_STEPS = 5
+
+# Minimum seconds between frames in the semi_fixed and variable modes, or None for one logic tick
+MIN_FRAME_INTERVAL = None
+
+# Milliseconds of component updates per tick before low priority components are deferred, or None
+LOGIC_BUDGET = None
+
+# Milliseconds spent initialising spawned objects per tick, or None to initialise them as soon as they spawn
+INIT_BUDGET = None
+
+frame_budget.budget = LOGIC_BUDGET
+init_budget.budget = INIT_BUDGET
+
+scheduler = Scheduler(1 / logic.getLogicTicRate(), SCHEDULER_MODE, MAX_CATCH_UP_STEPS, MIN_FRAME_INTERVAL)
+set_scheduler(scheduler)
 
 
 running = True
 while running:
-    now = clock()
-    elapsed = now - last_time
-    last_time = now
-
-    accumulator += elapsed
-    while accumulator > dt:
-        accumulator -= dt
+    for dt in scheduler.steps():
         logic.NextFrame()
 
-        for scene in logic.getSceneList():
-            update_scene(scene)
+        frame_budget.begin_tick()
+        update_scenes(logic.getSceneList(), dt)
+
+        end_tick()
 
         if logic.getExitKey() in logic.keyboard.active_events:
             running = False
             break
+
+    scheduler.wait()
+
+dispose_all()
+shutdown_compute_pool()
+shutdown_jobs()
@@ -0,0 +1,165 @@
+from collections import OrderedDict, defaultdict
+from logging import getLogger
+
+
+logger = getLogger(__name__)
+
+
+class Message:
+    """Base class of the message records of a Topic"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        values = ", ".join("{}={!r}".format(name, getattr(self, name)) for name in self.__slots__)
+        return "{}({})".format(self.__class__.__name__, values)
+
+
+class Topic:
+    """Typed message topic.
+
+    Messages are records with the given fields, recycled once they have been delivered, so subscribers must not keep
+    them (or should copy their values).
+
+    :param name: topic name
+    :param fields: names of message fields
+    """
+
+    def __init__(self, name, fields=()):
+        self.name = name
+        self.fields = tuple(fields)
+        self.record_type = type(name.title().replace('_', '') + "Message", (Message,), {'__slots__': self.fields})
+
+        self.published_count = 0
+        self.delivered_count = 0
+
+        self._free_records = []
+
+    def __repr__(self):
+        return "Topic({!r}, {!r})".format(self.name, self.fields)
+
+    def make_record(self, values):
+        try:
+            record = self._free_records.pop()
+
+        except IndexError:
+            record = self.record_type()
+
+        for name in self.fields:
+            setattr(record, name, values.pop(name, None))
+
+        if values:
+            self.recycle_record(record)
+            raise TypeError("Invalid fields {} for topic {!r}: expected any of {}"
+                            .format(tuple(values), self.name, self.fields))
+
+        return record
+
+    def recycle_record(self, record):
+        for name in self.fields:
+            setattr(record, name, None)
+
+        self._free_records.append(record)
+
+    def preallocate(self, count):
+        """Create records up front, to avoid allocating them during play"""
+        self._free_records.extend(self.record_type() for _ in range(count))
+
+
+class MessageBus:
+    """Queue messages published during a tick, and deliver them in one batch per topic and subscriber.
+
+    Subscribers are called with the list of messages of the topic published since the last delivery. Only topics with
+    queued messages are visited.
+    """
+
+    def __init__(self):
+        self._subscribers = defaultdict(list)
+        self._owned_subscriptions = defaultdict(list)
+        self._queues = OrderedDict()
+
+    def subscribe(self, topic, callback, owner=None):
+        """Call callback(messages) with each batch of messages of a topic.
+
+        :param owner: component whose subscriptions are removed when it is forgotten
+        """
+        self._subscribers[topic].append(callback)
+
+        if owner is not None:
+            self._owned_subscriptions[owner].append((topic, callback))
+
+    def _remove_subscriber(self, topic, callback):
+        subscribers = self._subscribers.get(topic)
+        if subscribers is None or callback not in subscribers:
+            return False
+
+        subscribers.remove(callback)
+        if not subscribers:
+            del self._subscribers[topic]
+
+        return True
+
+    def unsubscribe(self, topic, callback, owner=None):
+        """Stop calling callback with the messages of a topic.
+
+        :param owner: component which owns the subscription, if known
+        """
+        if not self._remove_subscriber(topic, callback):
+            raise ValueError("{!r} is not subscribed to {!r}".format(callback, topic.name))
+
+        # Remove the subscription from its owner, so that forgetting the owner doesn't remove it again
+        subscription = topic, callback
+        subscriptions = self._owned_subscriptions.get(owner)
+
+        if subscriptions is None or subscription not in subscriptions:
+            owner, subscriptions = next(((component, subscriptions)
+                                         for component, subscriptions in self._owned_subscriptions.items()
+                                         if subscription in subscriptions), (None, None))
+            if subscriptions is None:
+                return
+
+        subscriptions.remove(subscription)
+        if not subscriptions:
+            del self._owned_subscriptions[owner]
+
+    def forget(self, components):
+        """Remove the subscriptions owned by components (e.g. of ended objects)"""
+        for component in components:
+            for topic, callback in self._owned_subscriptions.pop(component, ()):
+                # Tolerate subscriptions which were already removed
+                self._remove_subscriber(topic, callback)
+
+    def publish(self, topic, **values):
+        """Queue a message of a topic, with the given field values"""
+        record = topic.make_record(values)
+        topic.published_count += 1
+
+        try:
+            self._queues[topic].append(record)
+
+        except KeyError:
+            self._queues[topic] = [record]
+
+    def deliver(self):
+        """Deliver the queued messages; messages published by subscribers are delivered next time"""
+        if not self._queues:
+            return
+
+        queues = self._queues
+        self._queues = OrderedDict()
+
+        for topic, messages in queues.items():
+            subscribers = self._subscribers.get(topic)
+
+            if subscribers:
+                for callback in tuple(subscribers):
+                    try:
+                        callback(messages)
+
+                    except Exception:
+                        logger.exception("Error delivering {!r} messages to {!r}".format(topic.name, callback))
+
+                topic.delivered_count += len(messages) * len(subscribers)
+
+            for record in messages:
+                topic.recycle_record(record)
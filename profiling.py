@@ -0,0 +1,175 @@
+from collections import OrderedDict, deque
+from json import dump
+from time import perf_counter
+
+
+def get_class_name(cls):
+    return "{}.{}".format(cls.__module__, cls.__name__)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class ClassStatistics:
+    """Timings of the start(), update() (or commit()) and compute() calls of a component class"""
+
+    def __init__(self, name, window):
+        self.name = name
+
+        self.start_calls = 0
+        self.start_time = 0.0
+
+        self.update_calls = 0
+        self.update_time = 0.0
+
+        # Time spent in compute() on worker threads, which isn't part of the tick times
+        self.compute_calls = 0
+        self.compute_time = 0.0
+
+        self.tick_times = deque(maxlen=window)
+        self._tick_time = 0.0
+        self._tick_calls = 0
+
+    def add_start(self, elapsed):
+        self.start_calls += 1
+        self.start_time += elapsed
+
+    def add_update(self, elapsed, calls=1):
+        self._tick_time += elapsed
+        self._tick_calls += calls
+
+    def add_compute(self, elapsed):
+        self.compute_calls += 1
+        self.compute_time += elapsed
+
+    def end_tick(self):
+        if not self._tick_calls:
+            return
+
+        self.update_calls += self._tick_calls
+        self.update_time += self._tick_time
+        self.tick_times.append(self._tick_time)
+
+        self._tick_time = 0.0
+        self._tick_calls = 0
+
+    def summary(self):
+        tick_times = sorted(self.tick_times)
+        mean_time = sum(tick_times) / len(tick_times) if tick_times else 0.0
+
+        return OrderedDict((
+            ("start_calls", self.start_calls),
+            ("start_time", self.start_time),
+            ("update_calls", self.update_calls),
+            ("update_time", self.update_time),
+            ("compute_calls", self.compute_calls),
+            ("compute_time", self.compute_time),
+            ("mean_tick_time", mean_time),
+            ("p95_tick_time", percentile(tick_times, 0.95)),
+            ("max_tick_time", tick_times[-1] if tick_times else 0.0),
+        ))
+
+
+class Profiler:
+    """Per component class instrumentation of start() and update(), and of the compute() and commit() of thread-safe
+    components (see compute_pool), whose commit() calls count as updates.
+
+    When disabled, update pipelines are built from the plain bound methods, so profiling costs nothing.
+
+    :param window: number of ticks over which per-tick statistics are computed
+    """
+
+    def __init__(self, window=600):
+        self.window = window
+        self.enabled = False
+
+        self.init_calls = 0
+        self.init_time = 0.0
+
+        self.dump_path = None
+        self.dump_interval = 0.0
+        self._last_dump_time = 0.0
+
+        self._statistics = OrderedDict()
+
+    def enable(self, dump_path=None, dump_interval=10.0):
+        """Start collecting statistics.
+
+        :param dump_path: path of file to periodically write the statistics to, or None
+        :param dump_interval: seconds between writes to the dump file
+        """
+        self.enabled = True
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self._last_dump_time = perf_counter()
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.init_calls = 0
+        self.init_time = 0.0
+        self._statistics.clear()
+
+    def get_class_statistics(self, cls):
+        name = get_class_name(cls)
+
+        try:
+            return self._statistics[name]
+
+        except KeyError:
+            statistics = self._statistics[name] = ClassStatistics(name, self.window)
+            return statistics
+
+    def add_init(self, elapsed):
+        self.init_calls += 1
+        self.init_time += elapsed
+
+    def instrument_update(self, cls, update, calls=1):
+        """Wrap an update callable to record its duration against the given component class"""
+        statistics = self.get_class_statistics(cls)
+        add_update = statistics.add_update
+
+        def timed_update():
+            start_time = perf_counter()
+            update()
+            add_update(perf_counter() - start_time, calls)
+
+        return timed_update
+
+    def end_tick(self):
+        for statistics in self._statistics.values():
+            statistics.end_tick()
+
+        if self.dump_path is not None:
+            now = perf_counter()
+            if now - self._last_dump_time >= self.dump_interval:
+                self._last_dump_time = now
+                self.dump(self.dump_path)
+
+    def get_statistics(self):
+        """Return an ordered mapping of component class name to summary statistics"""
+        return OrderedDict((name, statistics.summary()) for name, statistics in self._statistics.items())
+
+    def get_slowest(self, count=5, key="p95_tick_time"):
+        """Return the (name, summary) pairs of the component classes with the greatest statistic"""
+        statistics = self.get_statistics().items()
+        return sorted(statistics, key=lambda item: item[1][key], reverse=True)[:count]
+
+    def dump(self, file_path):
+        data = OrderedDict((
+            ("init_calls", self.init_calls),
+            ("init_time", self.init_time),
+            ("classes", self.get_statistics()),
+        ))
+
+        with open(file_path, 'w') as f:
+            dump(data, f, indent=4)
+
+
+profiler = Profiler()
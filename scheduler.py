@@ -0,0 +1,173 @@
+from collections import deque
+from time import perf_counter, sleep
+
+
+MODE_FIXED = "fixed"
+MODE_SEMI_FIXED = "semi_fixed"
+MODE_VARIABLE = "variable"
+
+MODES = MODE_FIXED, MODE_SEMI_FIXED, MODE_VARIABLE
+
+
+class FrameStatistics:
+    """Statistics of the frames and steps run by a Scheduler"""
+
+    def __init__(self, window=120):
+        self.frame_count = 0
+        self.step_count = 0
+        self.dropped_steps = 0
+        self.dropped_time = 0.0
+
+        self.frame_times = deque(maxlen=window)
+        self.step_times = deque(maxlen=window)
+
+    def add_frame(self, elapsed):
+        self.frame_count += 1
+        self.frame_times.append(elapsed)
+
+    def add_step(self, elapsed):
+        self.step_count += 1
+        self.step_times.append(elapsed)
+
+    def add_dropped(self, steps, elapsed):
+        self.dropped_steps += steps
+        self.dropped_time += elapsed
+
+    @property
+    def mean_frame_time(self):
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    @property
+    def mean_step_time(self):
+        return sum(self.step_times) / len(self.step_times) if self.step_times else 0.0
+
+    @property
+    def max_step_time(self):
+        return max(self.step_times) if self.step_times else 0.0
+
+
+class Scheduler:
+    """Decide when to run logic steps, and with what time delta.
+
+    fixed: steps of exactly `step` seconds, with interpolation alpha of the remaining time
+    semi_fixed: steps of at most `step` seconds which consume the elapsed time, except for remainders shorter than
+        `min_step_fraction` of a step, which are carried over to the next frame
+    variable: a single step per frame of the elapsed time
+
+    After a stall, at most `max_steps` steps (or `max_steps * step` seconds of time) are caught up, and the remaining
+    time is dropped, so that one slow frame cannot cause progressively slower frames.
+
+    :param step: step duration in seconds
+    :param mode: one of MODES
+    :param max_steps: maximum number of steps to catch up in one frame
+    :param min_interval: minimum seconds between frames in the semi_fixed and variable modes, or None for one step
+    """
+
+    # Wake up this long before the next step is due, to absorb sleep inaccuracy
+    sleep_margin = 0.001
+
+    # Shortest partial step run in the semi_fixed mode, as a fraction of a step, so that sleep overshoot doesn't cause
+    # extra steps of a fraction of a millisecond
+    min_step_fraction = 0.5
+
+    def __init__(self, step, mode=MODE_FIXED, max_steps=5, min_interval=None, clock=perf_counter):
+        if mode not in MODES:
+            raise ValueError("Invalid mode {!r}: expected one of {}".format(mode, MODES))
+
+        self.step = step
+        self.mode = mode
+        self.max_steps = max_steps
+        self.min_interval = step if min_interval is None else min_interval
+        self.statistics = FrameStatistics()
+
+        # Delta time of the current step, and interpolation factor between the last two steps
+        self.dt = step
+        self.alpha = 0.0
+
+        self._clock = clock
+        self._last_time = clock()
+        self._accumulator = 0.0
+
+    def _get_step_times(self, elapsed):
+        statistics = self.statistics
+        max_time = self.max_steps * self.step
+
+        if self.mode == MODE_VARIABLE:
+            if elapsed > max_time:
+                statistics.add_dropped(0, elapsed - max_time)
+                elapsed = max_time
+
+            return [elapsed]
+
+        accumulator = self._accumulator + elapsed
+        step = self.step
+
+        if self.mode == MODE_FIXED:
+            count = int(accumulator // step)
+            if count > self.max_steps:
+                dropped = count - self.max_steps
+                statistics.add_dropped(dropped, dropped * step)
+                accumulator -= dropped * step
+                count = self.max_steps
+
+            self._accumulator = accumulator - count * step
+            self.alpha = self._accumulator / step
+            return [step] * count
+
+        if accumulator > max_time:
+            statistics.add_dropped(0, accumulator - max_time)
+            accumulator = max_time
+
+        step_times = [step] * int(accumulator // step)
+        remainder = accumulator - len(step_times) * step
+        if remainder >= self.min_step_fraction * step:
+            step_times.append(remainder)
+            remainder = 0.0
+
+        self._accumulator = remainder
+        return step_times
+
+    def steps(self):
+        """Yield the delta time of each step to run for the time elapsed since the last call"""
+        clock = self._clock
+
+        now = clock()
+        elapsed = now - self._last_time
+        self._last_time = now
+
+        statistics = self.statistics
+        statistics.add_frame(elapsed)
+
+        for dt in self._get_step_times(elapsed):
+            self.dt = dt
+
+            start_time = clock()
+            yield dt
+            statistics.add_step(clock() - start_time)
+
+    def get_time_until_next_step(self):
+        since_last = self._clock() - self._last_time
+
+        if self.mode == MODE_FIXED:
+            return self.step - self._accumulator - since_last
+
+        # Time carried over in the semi_fixed mode is already due
+        return self.min_interval - self._accumulator - since_last
+
+    def wait(self):
+        """Sleep until the next step is due, or yield to other threads if it is due imminently"""
+        remaining = self.get_time_until_next_step() - self.sleep_margin
+        sleep(remaining if remaining > 0.0 else 0.0)
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    """Return the scheduler driving the mainloop, or None"""
+    return _scheduler
+
+
+def set_scheduler(scheduler):
+    global _scheduler
+    _scheduler = scheduler
@@ -0,0 +1,459 @@
+"""Binary snapshots of the state of every live component, for quick-saves and checkpoint/rollback.
+
+A snapshot holds the Field columns of each component class, which are written and read in bulk rather than per
+component, and the names of the objects they belong to, which are stored once however many objects share them (e.g.
+those spawned from the same template). State which isn't held in Fields, including component arguments, is not
+included: started components don't read their arguments again, so restoring them would have no effect.
+
+Objects are identified by their scene name, the order in which their components were initialised and their name, so a
+snapshot can only be restored to the same objects, e.g. for a rollback or after reloading the level. Restoring to the
+scene the snapshot was taken from matches objects exactly; otherwise, objects initialised in a different order are
+matched by name, unless several objects could be the same one. Objects which can't be found (or matched unambiguously)
+are skipped. Snapshots use the native byte order, and are refused by platforms with a different one.
+"""
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from io import BytesIO
+from logging import getLogger
+from mmap import mmap, ACCESS_READ
+from os import replace
+from struct import Struct
+from sys import byteorder
+
+from bge import logic
+from common import load_component_class
+from component_store import get_store, has_fields
+from component_system import COMPONENTS_NAME, REGISTRY_NAME
+
+SNAPSHOT_MAGIC = b"BGCS"
+SNAPSHOT_VERSION = 1
+
+_header = Struct("=4sHBI")
+_count = Struct("=I")
+_short = Struct("=H")
+_token = Struct("=Q")
+_byte_order = 0 if byteorder == 'little' else 1
+
+logger = getLogger(__name__)
+
+
+def get_import_path(cls):
+    return "{}.{}".format(cls.__module__, cls.__name__)
+
+
+class StringTable:
+    """Numbered table of the distinct strings in a snapshot"""
+
+    def __init__(self):
+        self.strings = []
+        self._ids = {}
+
+    def add(self, string):
+        # Most strings (e.g. object names) are only added once, so avoid raising KeyError for them
+        string_id = self._ids.get(string)
+        if string_id is None:
+            string_id = self._ids[string] = len(self.strings)
+            self.strings.append(string)
+
+        return string_id
+
+    def update(self, strings):
+        for string in strings:
+            self.add(string)
+
+    def write(self, write):
+        """Write the byte lengths of the strings, followed by the strings in one block"""
+        data = [string.encode('utf-8') for string in self.strings]
+        write(_count.pack(len(data)))
+        write(array('I', [len(string_data) for string_data in data]).tobytes())
+        write(b"".join(data))
+
+
+# Object number of components of a store which aren't in the snapshot
+MISSING = 0xFFFFFFFF
+
+
+def _add_locations(components, object_number, store_locations):
+    """Record the object number and component index of components with Fields, by their store index"""
+    for component_index, component in enumerate(components):
+        cls = component.__class__
+        if not has_fields(cls):
+            continue
+
+        try:
+            object_numbers, component_indices = store_locations[cls]
+
+        except KeyError:
+            count = get_store(cls).count
+            object_numbers, component_indices = store_locations[cls] = array('I', [MISSING]) * count, \
+                array('H', [0]) * count
+
+        store_index = component._store_index
+        object_numbers[store_index] = object_number
+        component_indices[store_index] = component_index
+
+
+def _collect_objects(scene, strings, store_locations, object_number):
+    """Return the table of the initialised objects of a scene, and record the location of each of their components.
+
+    Objects are numbered across every scene in the snapshot, starting from object_number.
+    """
+    serials, name_ids = array('I'), array('I')
+
+    registry = scene.get(REGISTRY_NAME)
+    if registry is None:
+        return (strings.add(scene.name), 0, serials, name_ids), object_number
+
+    serial_numbers = registry.serial_numbers
+    for obj, components in registry.components.items():
+        # Skip objects which have ended since the registry was last refreshed
+        if obj.invalid:
+            continue
+
+        serials.append(serial_numbers[obj])
+        name_ids.append(strings.add(obj.name))
+        _add_locations(components, object_number, store_locations)
+
+        object_number += 1
+
+    return (strings.add(scene.name), registry.token, serials, name_ids), object_number
+
+
+def _write_fields(write, strings, store, object_numbers, component_indices):
+    """Write the Field columns of a store, restricted to the components in the snapshot"""
+    write(_count.pack(strings.add(get_import_path(store.cls))))
+
+    fields = store.fields
+    write(_short.pack(len(fields)))
+    for name, field in fields.items():
+        write(_count.pack(strings.add(name)))
+        write(field.typecode.encode('ascii'))
+
+    # Every component of the store is usually in the snapshot, so its columns can be written as they are
+    if MISSING not in object_numbers:
+        write(_count.pack(len(object_numbers)))
+        write(object_numbers.tobytes())
+        write(component_indices.tobytes())
+
+        for name in fields:
+            write(store.get_column(name).tobytes())
+
+        return
+
+    selected = [index for index, number in enumerate(object_numbers) if number != MISSING]
+    write(_count.pack(len(selected)))
+    write(array('I', [object_numbers[index] for index in selected]).tobytes())
+    write(array('H', [component_indices[index] for index in selected]).tobytes())
+
+    for name, field in fields.items():
+        column = store.columns[name]
+        write(array(field.typecode, [column[index] for index in selected]).tobytes())
+
+
+def write_snapshot(stream, scenes=None):
+    """Write a snapshot of the components of some scenes to a binary stream.
+
+    :param stream: writable binary file-like object
+    :param scenes: scenes to include, or None for every scene
+    """
+    if scenes is None:
+        scenes = logic.getSceneList()
+
+    strings = StringTable()
+    store_locations = OrderedDict()
+
+    scene_tables = []
+    object_number = 0
+    for scene in scenes:
+        scene_table, object_number = _collect_objects(scene, strings, store_locations, object_number)
+        scene_tables.append(scene_table)
+
+    # Field names are added to the string table before it is written
+    for cls in store_locations:
+        strings.add(get_import_path(cls))
+        strings.update(get_store(cls).fields)
+
+    write = stream.write
+    write(_header.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _byte_order, len(scenes)))
+    strings.write(write)
+
+    for name_id, token, serials, name_ids in scene_tables:
+        write(_count.pack(name_id))
+        write(_token.pack(token))
+        write(_count.pack(len(serials)))
+        write(serials.tobytes())
+        write(name_ids.tobytes())
+
+    write(_count.pack(len(store_locations)))
+    for cls, (object_numbers, component_indices) in store_locations.items():
+        _write_fields(write, strings, get_store(cls), object_numbers, component_indices)
+
+
+def take_snapshot(scenes=None):
+    """Return a snapshot of the components of some scenes (or None for every scene) as bytes"""
+    stream = BytesIO()
+    write_snapshot(stream, scenes)
+    return stream.getvalue()
+
+
+def save_snapshot(path, scenes=None):
+    """Stream a snapshot of the components of some scenes (or None for every scene) to a file.
+
+    The snapshot is written to a temporary file which then replaces the file at path, so an interrupted save doesn't
+    overwrite the previous snapshot.
+    """
+    temporary_path = path + ".tmp"
+    with open(temporary_path, 'wb') as f:
+        write_snapshot(f, scenes)
+
+    replace(temporary_path, path)
+
+
+class SnapshotReader:
+    """Read values from a buffer holding a snapshot.
+
+    Views of the buffer are released as soon as they are read, even if reading fails, so that a memory-mapped buffer
+    can be closed.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.offset = 0
+
+    def unpack(self, struct):
+        with self.read_bytes(struct.size) as data:
+            return struct.unpack(data)
+
+    def read_count(self):
+        return self.unpack(_count)[0]
+
+    def read_short(self):
+        return self.unpack(_short)[0]
+
+    def read_bytes(self, size):
+        end = self.offset + size
+        if end > len(self.buffer):
+            raise ValueError("Snapshot is truncated")
+
+        data = self.buffer[self.offset:end]
+        self.offset = end
+        return data
+
+    def read_array(self, typecode, count):
+        values = array(typecode)
+        with self.read_bytes(count * values.itemsize) as data:
+            values.frombytes(data)
+
+        return values
+
+    def read_typecode(self):
+        with self.read_bytes(1) as data:
+            return chr(data[0])
+
+    def read_strings(self, lengths):
+        """Read consecutive UTF-8 strings of the given byte lengths"""
+        strings = []
+        start = 0
+
+        with self.read_bytes(sum(lengths)) as data:
+            for length in lengths:
+                end = start + length
+                with data[start:end] as string_data:
+                    strings.append(str(string_data, 'utf-8'))
+
+                start = end
+
+        return strings
+
+
+def _read_strings(reader):
+    return reader.read_strings(reader.read_array('I', reader.read_count()))
+
+
+def _match_by_name(objects, names, registry):
+    """Match the objects which weren't found by serial number to the remaining objects of the same name, returning the
+    number which are ambiguous.
+    """
+    matched = set(objects)
+    candidates = defaultdict(list)
+    for obj in registry.components:
+        if obj not in matched and not obj.invalid:
+            candidates[obj.name].append(obj)
+
+    unmatched = [i for i, obj in enumerate(objects) if obj is None]
+    name_counts = Counter(names[i] for i in unmatched)
+    ambiguous = 0
+
+    for i in unmatched:
+        name = names[i]
+        name_candidates = candidates.get(name)
+        if not name_candidates:
+            continue
+
+        if len(name_candidates) == 1 and name_counts[name] == 1:
+            objects[i] = name_candidates[0]
+
+        else:
+            ambiguous += 1
+
+    return ambiguous
+
+
+def _read_objects(reader, strings, scenes_by_name, objects):
+    """Find the objects of a scene, appending each object (or None if not found) to objects.
+
+    Return the number of objects which weren't found, and of those which were ambiguous.
+    """
+    scene = scenes_by_name.get(strings[reader.read_count()])
+    token = reader.unpack(_token)[0]
+    count = reader.read_count()
+    serials = reader.read_array('I', count)
+    name_ids = reader.read_array('I', count)
+
+    # Objects of scenes which aren't being restored aren't missing
+    if scene is None:
+        objects.extend([None] * count)
+        return 0, 0
+
+    registry = scene.get(REGISTRY_NAME)
+    if registry is None:
+        objects.extend([None] * count)
+        return count, 0
+
+    names = [strings[name_id] for name_id in name_ids]
+    objects_by_serial = {serial: obj for obj, serial in registry.serial_numbers.items() if not obj.invalid}
+
+    scene_objects = [objects_by_serial.get(serial) for serial in serials]
+    for i, obj in enumerate(scene_objects):
+        if obj is not None and obj.name != names[i]:
+            scene_objects[i] = None
+
+    # Objects missing from the registry the snapshot was taken from have ended, but a reloaded scene may have
+    # initialised its objects in a different order
+    ambiguous = 0
+    if token != registry.token:
+        ambiguous = _match_by_name(scene_objects, names, registry)
+
+    objects.extend(scene_objects)
+    return scene_objects.count(None) - ambiguous, ambiguous
+
+
+def _find_store_index(obj, component_index, cls):
+    if obj is None:
+        return -1
+
+    components = obj.get(COMPONENTS_NAME, ())
+    if component_index >= len(components):
+        return -1
+
+    component = components[component_index]
+    if component.__class__ is not cls:
+        return -1
+
+    return component._store_index
+
+
+def _read_fields(reader, strings, objects):
+    """Restore the Field columns of a component class, returning the number of components restored"""
+    import_path = strings[reader.read_count()]
+    field_types = [(strings[reader.read_count()], reader.read_typecode()) for _ in range(reader.read_short())]
+
+    count = reader.read_count()
+    object_numbers = reader.read_array('I', count)
+    component_indices = reader.read_array('H', count)
+    columns = [(name, reader.read_array(typecode, count)) for name, typecode in field_types]
+
+    cls = load_component_class(import_path)
+    store = get_store(cls)
+
+    for name, typecode in field_types:
+        field = store.fields.get(name)
+        if field is None or field.typecode != typecode:
+            raise ValueError("Field {!r} of {!r} doesn't match the snapshot".format(name, import_path))
+
+    store_indices = [_find_store_index(objects[number], index, cls)
+                     for number, index in zip(object_numbers, component_indices)]
+
+    # Restoring to the components the snapshot was taken from leaves them in the same order
+    if store_indices == list(range(count)):
+        for name, values in columns:
+            store.columns[name][:count] = values
+
+        return count
+
+    restored = [(i, store_index) for i, store_index in enumerate(store_indices) if store_index >= 0]
+    for name, values in columns:
+        column = store.columns[name]
+        for i, store_index in restored:
+            column[store_index] = values[i]
+
+    return len(restored)
+
+
+def restore_snapshot(data, scenes=None):
+    """Restore a snapshot to the components of some scenes, returning the number of components with restored Fields.
+
+    Only Field values are restored: component arguments, and state which isn't held in Fields, are left as they are.
+
+    :param data: bytes-like object holding the snapshot
+    :param scenes: scenes to restore, or None for every scene. Scenes are matched by name.
+    """
+    # Release the view of data on errors too, so that a memory-mapped file can be closed
+    with memoryview(data) as buffer:
+        return _restore(SnapshotReader(buffer), scenes)
+
+
+def _restore(reader, scenes):
+    magic, version, byte_order, scene_count = reader.unpack(_header)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Data is not a component snapshot")
+
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("Unsupported snapshot version {}: expected {}".format(version, SNAPSHOT_VERSION))
+
+    if byte_order != _byte_order:
+        raise ValueError("Snapshot byte order doesn't match this platform")
+
+    if scenes is None:
+        scenes = logic.getSceneList()
+
+    scenes_by_name = {}
+    for scene in scenes:
+        scenes_by_name.setdefault(scene.name, scene)
+
+    strings = _read_strings(reader)
+
+    objects = []
+    missing = ambiguous = 0
+    for _ in range(scene_count):
+        scene_missing, scene_ambiguous = _read_objects(reader, strings, scenes_by_name, objects)
+        missing += scene_missing
+        ambiguous += scene_ambiguous
+
+    if missing:
+        logger.warning("{} objects in the snapshot were not found".format(missing))
+
+    if ambiguous:
+        logger.warning("{} objects in the snapshot were skipped, as several objects of the same name could be them"
+                       .format(ambiguous))
+
+    restored = 0
+    for _ in range(reader.read_count()):
+        restored += _read_fields(reader, strings, objects)
+
+    return restored
+
+
+def load_snapshot(path, use_mmap=False, scenes=None):
+    """Restore a snapshot from a file, returning the number of components with restored Fields.
+
+    :param path: path of the snapshot file
+    :param use_mmap: memory-map the file rather than reading it into memory, for large snapshots
+    :param scenes: scenes to restore, or None for every scene
+    """
+    with open(path, 'rb') as f:
+        if not use_mmap:
+            return restore_snapshot(f.read(), scenes)
+
+        with mmap(f.fileno(), 0, access=ACCESS_READ) as buffer:
+            return restore_snapshot(buffer, scenes)
@@ -0,0 +1,315 @@
+from bisect import bisect_left
+from collections import defaultdict
+from heapq import heappush, heappop
+from math import sqrt
+
+
+class SpatialGrid:
+    """Spatial hash of objects by the grid cell containing their world position"""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)
+        self.object_cells = {}
+
+    def get_cell(self, position):
+        size = self.cell_size
+        return position[0] // size, position[1] // size, position[2] // size
+
+    def get_distance_range(self, cell, position):
+        """Return the nearest and farthest distances from a position to the points of a cell"""
+        size = self.cell_size
+        near = far = 0.0
+
+        for index, value in zip(cell, position):
+            low = index * size
+            high = low + size
+
+            if value < low:
+                near += (low - value) ** 2
+
+            elif value > high:
+                near += (value - high) ** 2
+
+            far += max(value - low, high - value) ** 2
+
+        return sqrt(near), sqrt(far)
+
+    def _move(self, obj, cell, previous_cell):
+        if previous_cell is not None:
+            self._remove_from_cell(obj, previous_cell)
+
+        self.cells[cell].add(obj)
+        self.object_cells[obj] = cell
+
+    def update(self, obj):
+        """Move an object to the cell of its current position, returning True if its cell changed"""
+        cell = self.get_cell(obj.worldPosition)
+        previous_cell = self.object_cells.get(obj)
+
+        if cell == previous_cell:
+            return False
+
+        self._move(obj, cell, previous_cell)
+        return True
+
+    def update_objects(self, objects):
+        """Move objects to the cells of their current positions, returning those whose cell changed"""
+        size = self.cell_size
+        object_cells = self.object_cells
+        moved = []
+
+        for obj in objects:
+            position = obj.worldPosition
+            cell = position[0] // size, position[1] // size, position[2] // size
+            previous_cell = object_cells.get(obj)
+
+            if cell != previous_cell:
+                self._move(obj, cell, previous_cell)
+                moved.append(obj)
+
+        return moved
+
+    def _remove_from_cell(self, obj, cell):
+        objects = self.cells[cell]
+        objects.discard(obj)
+        if not objects:
+            del self.cells[cell]
+
+    def remove(self, obj):
+        cell = self.object_cells.pop(obj, None)
+        if cell is not None:
+            self._remove_from_cell(obj, cell)
+
+
+def get_band_interval(bands, distance):
+    """Return the update interval of the first band containing the distance, or 0 (dormant) if there is none"""
+    for band_distance, interval in bands:
+        if distance <= band_distance:
+            return interval
+
+    return 0
+
+
+def get_distance(a, b):
+    return sqrt(sum((i - j) ** 2 for i, j in zip(a, b)))
+
+
+class LevelOfDetail:
+    """Throttle components by their distance from a focus object.
+
+    Components declare `lod_bands`, a sequence of (distance, update interval) pairs sorted by distance. Beyond the last
+    distance they are dormant and not updated. Distances are measured from the focus object (by default the active
+    camera) to the component's object, and are refreshed every `refresh_interval` ticks.
+
+    Objects are kept in a grid, which is updated incrementally as they move. Each cell lies within one band of every
+    component until the focus has travelled far enough to cross a band boundary, so a refresh only re-evaluates the
+    objects which changed cell, those in cells which straddle a band boundary, and those in cells which the focus may
+    have moved into a different band.
+
+    :param cell_size: size of grid cells
+    :param refresh_interval: ticks between updates of object positions and bands
+    """
+
+    def __init__(self, cell_size=25.0, refresh_interval=10):
+        self.grid = SpatialGrid(cell_size)
+        self.refresh_interval = refresh_interval
+        self.focus = None
+
+        # Update interval of each component with lod_bands; 0 is dormant
+        self.intervals = {}
+
+        self._components = {}
+        self._focus_position = None
+        self._tick = 0
+
+        # Sorted distances of every band
+        self._band_distances = set()
+        self._boundaries = []
+
+        # Total distance travelled by the focus, the (near, far) distance range of each evaluated cell, a heap of the
+        # travelled distance at which cells may change band, and the cells which straddle a band boundary
+        self._travelled = 0.0
+        self._cell_ranges = {}
+        self._rechecks = []
+        self._straddling = set()
+
+        # Whether every cell must be measured at the next refresh
+        self._remeasure = True
+
+    def add(self, obj, components):
+        lod_components = [c for c in components if c.lod_bands is not None]
+        if not lod_components:
+            return
+
+        band_distances = self._band_distances
+        for component in lod_components:
+            for distance, interval in component.lod_bands:
+                if distance not in band_distances:
+                    self._add_band_distance(distance)
+
+        self._components[obj] = lod_components
+
+        focus_position = self._focus_position
+        if focus_position is not None:
+            distance = get_distance(obj.worldPosition, focus_position)
+            self._update_object(obj, focus_position, distance, distance)
+
+    def _add_band_distance(self, distance):
+        self._band_distances.add(distance)
+        self._boundaries = sorted(self._band_distances)
+
+        # Every cell must be measured against the new boundary
+        self._cell_ranges.clear()
+        self._rechecks.clear()
+        self._straddling.clear()
+        self._remeasure = True
+
+    def remove(self, obj, components):
+        self.grid.remove(obj)
+
+        for component in self._components.pop(obj, ()):
+            self.intervals.pop(component, None)
+
+    def _get_focus_position(self, scene):
+        focus = self.focus
+        if focus is None or focus.invalid:
+            focus = scene.active_camera
+
+        return tuple(focus.worldPosition)
+
+    def _update_object(self, obj, focus_position, near, far):
+        """Update the intervals of the components of an object, whose distance is between near and far.
+
+        Returns True if any changed.
+        """
+        intervals = self.intervals
+        distance = None
+        changed = False
+
+        for component in self._components[obj]:
+            bands = component.lod_bands
+            interval = get_band_interval(bands, near)
+
+            if interval != get_band_interval(bands, far):
+                if distance is None:
+                    distance = get_distance(obj.worldPosition, focus_position)
+
+                interval = get_band_interval(bands, distance)
+
+            if intervals.get(component) != interval:
+                intervals[component] = interval
+                changed = True
+
+        return changed
+
+    def _measure_cell(self, cell, focus_position):
+        """Record the distance range of a cell, returning its previous band index (or None if it straddled bands)"""
+        near, far = self.grid.get_distance_range(cell, focus_position)
+        boundaries = self._boundaries
+
+        # Number of band distances below the range, which is the same at both ends if the cell lies within one band
+        index = bisect_left(boundaries, near)
+        if index != bisect_left(boundaries, far):
+            index = None
+            self._straddling.add(cell)
+
+        else:
+            self._straddling.discard(cell)
+
+            # Distances change by at most the distance the focus travels, so the cell stays in its band until then
+            slack = min(near - boundaries[index - 1] if index else far,
+                        boundaries[index] - far if index < len(boundaries) else near)
+            heappush(self._rechecks, (self._travelled + slack, cell))
+
+        previous_range = self._cell_ranges.get(cell)
+        self._cell_ranges[cell] = near, far, index
+        return None if previous_range is None else previous_range[2]
+
+    def _evaluate_cell(self, cell, focus_position):
+        near, far = self._cell_ranges[cell][:2]
+        update_object = self._update_object
+        changed = False
+
+        for obj in self.grid.cells[cell]:
+            if update_object(obj, focus_position, near, far):
+                changed = True
+
+        return changed
+
+    def update(self, scene):
+        """Move objects between cells and refresh bands, returning True if any component's interval changed"""
+        self._tick += 1
+        if self._tick % self.refresh_interval and self._focus_position is not None:
+            return False
+
+        grid = self.grid
+        cells = grid.cells
+        cell_ranges = self._cell_ranges
+        moved_objects = grid.update_objects(self._components)
+
+        focus_position = self._get_focus_position(scene)
+        if self._focus_position is not None:
+            self._travelled += get_distance(focus_position, self._focus_position)
+
+        self._focus_position = focus_position
+
+        evaluated = set()
+        changed = False
+
+        if self._remeasure:
+            self._remeasure = False
+
+            for cell in cells:
+                self._measure_cell(cell, focus_position)
+                evaluated.add(cell)
+                if self._evaluate_cell(cell, focus_position):
+                    changed = True
+
+            return changed
+
+        # Cells which straddle a band boundary are measured exactly, as the focus or their objects may have moved
+        for cell in list(self._straddling):
+            if cell not in cells:
+                self._straddling.discard(cell)
+                del cell_ranges[cell]
+                continue
+
+            self._measure_cell(cell, focus_position)
+            evaluated.add(cell)
+            if self._evaluate_cell(cell, focus_position):
+                changed = True
+
+        # Cells which the focus may have moved into a different band
+        rechecks = self._rechecks
+        while rechecks and rechecks[0][0] <= self._travelled:
+            cell = heappop(rechecks)[1]
+            if cell not in cells:
+                cell_ranges.pop(cell, None)
+                continue
+
+            previous_index = self._measure_cell(cell, focus_position)
+            if previous_index != cell_ranges[cell][2] or previous_index is None:
+                evaluated.add(cell)
+                if self._evaluate_cell(cell, focus_position):
+                    changed = True
+
+        # Objects which were added, or moved into cells which weren't evaluated
+        for obj in moved_objects:
+            cell = grid.object_cells[obj]
+            if cell in evaluated:
+                continue
+
+            if cell not in cell_ranges:
+                self._measure_cell(cell, focus_position)
+                evaluated.add(cell)
+                if self._evaluate_cell(cell, focus_position):
+                    changed = True
+
+                continue
+
+            near, far = cell_ranges[cell][:2]
+            if self._update_object(obj, focus_position, near, far):
+                changed = True
+
+        return changed
@@ -8,7 +8,7 @@ from collections import OrderedDict, deque
 from collections.abc import Sequence
 from itertools import chain
 
-from .common import to_json_string, from_json_string
+from .common import to_json_string, from_json_string, encode_value, decode_value
 
 
 def enum_encode(self, index):
@@ -121,7 +121,7 @@ class GameObjectMixin(DynamicMixin):
         return self.owner_object.game.properties[self.name]
 
     def serialise(self, name, value):
-        """Serialise one of the Union values into a JSON string"""
+        """Serialise one of the Union values into a string"""
         try:
             encode, decode = modifiers[name]
         except KeyError:
@@ -129,11 +129,11 @@ class GameObjectMixin(DynamicMixin):
         else:
             value = encode(self, value)
 
-        return to_json_string(value)
+        return encode_value(value, name)
 
     def deserialise(self, name, value):
-        """Deserialise one of the Union values from a JSON string"""
-        value = from_json_string(value)
+        """Deserialise one of the Union values from a string"""
+        value = decode_value(value)
 
         try:
             encode, decode = modifiers[name]
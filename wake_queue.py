@@ -0,0 +1,116 @@
+from bge import logic
+from heapq import heappush, heappop
+
+
+def seconds_to_ticks(seconds, tick_rate=None):
+    """Convert seconds to a number of ticks, at the given rate or (if None) the logic tick rate"""
+    if tick_rate is None:
+        tick_rate = logic.getLogicTicRate()
+
+    return max(1, round(seconds * tick_rate))
+
+
+class WakeQueue:
+    """Sleeping components of a scene, and the conditions which wake them.
+
+    Deadlines are kept in a heap of ticks, and event subscriptions in tables keyed by event code, so the cost per tick
+    scales with the number of due deadlines and active events rather than the number of sleeping components.
+
+    Although written for components, any hashable item may be put to sleep.
+
+    :param on_change: callback invoked with an item and whether it is sleeping, when it falls asleep or wakes up
+    """
+
+    def __init__(self, on_change):
+        self.tick = 0
+        self.sleeping = {}
+
+        self._on_change = on_change
+        self._timers = []
+        self._event_subscribers = {}
+        self._message_subscribers = set()
+        self._sleep_count = 0
+
+    def sleep(self, component, ticks=None, events=(), messages=False):
+        """Stop updating a component until any of the wake conditions is met, or wake() is called.
+
+        :param component: component to sleep
+        :param ticks: number of ticks to sleep for, or None
+        :param events: keyboard or mouse event codes which wake the component when active
+        :param messages: wake the component when it is sent a message
+        """
+        if component in self.sleeping:
+            self.wake(component)
+
+        self._sleep_count += 1
+        token = self._sleep_count
+        events = tuple(events)
+
+        self.sleeping[component] = token, events
+
+        if ticks is not None:
+            heappush(self._timers, (self.tick + max(1, ticks), token, component))
+
+        for event in events:
+            try:
+                self._event_subscribers[event].add(component)
+
+            except KeyError:
+                self._event_subscribers[event] = {component}
+
+        if messages:
+            self._message_subscribers.add(component)
+
+        self._on_change(component, True)
+
+    def wake(self, component):
+        try:
+            token, events = self.sleeping.pop(component)
+
+        except KeyError:
+            return
+
+        # Timers are discarded lazily when they expire
+        for event in events:
+            subscribers = self._event_subscribers[event]
+            subscribers.discard(component)
+            if not subscribers:
+                del self._event_subscribers[event]
+
+        self._message_subscribers.discard(component)
+        self._on_change(component, False)
+
+    def notify_message(self, component):
+        if component in self._message_subscribers:
+            self.wake(component)
+
+    def forget(self, components):
+        """Remove components (e.g. of ended objects) from the queue"""
+        for component in components:
+            if component in self.sleeping:
+                self.wake(component)
+
+    def _wake_events(self, active_events):
+        subscribers = self._event_subscribers
+
+        for event in active_events:
+            if event in subscribers:
+                for component in list(subscribers[event]):
+                    self.wake(component)
+
+    def update(self):
+        """Wake components whose deadline has passed, or whose events are active"""
+        self.tick += 1
+        tick = self.tick
+
+        timers = self._timers
+        while timers and timers[0][0] <= tick:
+            deadline, token, component = heappop(timers)
+
+            state = self.sleeping.get(component)
+            if state is not None and state[0] == token:
+                self.wake(component)
+
+        if self._event_subscribers:
+            self._wake_events(logic.keyboard.active_events)
+            self._wake_events(logic.mouse.active_events)